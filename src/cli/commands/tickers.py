@@ -76,10 +76,7 @@ def list_aliases() -> None:
         if df.empty:
             console_info("No ticker aliases found.")
         else:
-            records = [
-                {str(k): v for k, v in record.items()}
-                for record in df.to_dict("records")
-            ]
+            records = df.rename(columns=str).to_dict("records")
             show_data_table(records, title="Ticker Aliases", max_rows=20)
 
     except OSError as e:
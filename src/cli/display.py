@@ -5,23 +5,15 @@ This module provides custom display functions for the folio CLI.
 
 from __future__ import annotations
 
+import math
 import os
 from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
-import pandas as pd
 from rich.columns import Columns
-from rich.console import Console, Group, RenderableType
+from rich.console import Group, RenderableType
 from rich.measure import Measurement
-from rich.progress import (
-    BarColumn,
-    Progress,
-    SpinnerColumn,
-    TaskProgressColumn,
-    TextColumn,
-    TimeRemainingColumn,
-)
 from rich.table import Table
 
 from cli.console import (
@@ -36,6 +28,9 @@ from utils import TXN_ESSENTIALS, Action, Column, TransactionContext
 if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Generator
 
+    import pandas as pd
+    from rich.progress import Progress
+
     from models import ImportResults
 
 # Minimum columns always shown for exclusions
@@ -71,6 +66,18 @@ TABLE_HEADER_HEIGHT = 2
 # Page progress display height (e.g., "Showing transactions 1-15 of 100").
 PAGE_PROGRESS_HEIGHT = 1
 
+# Navigation prompts shown below each page of transactions.
+PAGINATION_PROMPT_FIRST = (
+    "[dim]Press [bold]n[/bold] for next page, [bold]q[/bold] to quit[/dim]"
+)
+PAGINATION_PROMPT_LAST = (
+    "[dim]Press [bold]p[/bold] for previous page, [bold]q[/bold] to quit[/dim]"
+)
+PAGINATION_PROMPT_MIDDLE = (
+    "[dim]Press [bold]n[/bold] for next,"
+    " [bold]p[/bold] for previous, [bold]q[/bold] to quit[/dim]"
+)
+
 THEME_MERGED = "bright_blue"  # Merged panels - informational
 THEME_TRANSFORMS = "medium_purple3"  # Transforms - modification
 THEME_EXCLUDED = "dark_red"  # Excluded/rejected - removal
@@ -89,6 +96,10 @@ TRANSACTION_COLORS = {
     Action.SPLIT: "purple",
 }
 
+# Actions whose amounts are always shown as inflows (green) or outflows (red).
+INFLOW_ACTIONS: frozenset[Action] = frozenset({Action.SELL, Action.CONTRIBUTION})
+OUTFLOW_ACTIONS: frozenset[Action] = frozenset({Action.BUY, Action.WITHDRAWAL})
+
 
 def show_data_table(
     data: list[dict[str, Any]],
@@ -409,15 +420,10 @@ def _get_pagination_prompt(current_page: int, total_pages: int) -> str:
     is_last = current_page == total_pages - 1
 
     if is_first and not is_last:
-        return "[dim]Press [bold]n[/bold] for next page, [bold]q[/bold] to quit[/dim]"
+        return PAGINATION_PROMPT_FIRST
     if is_last and not is_first:
-        return (
-            "[dim]Press [bold]p[/bold] for previous page, [bold]q[/bold] to quit[/dim]"
-        )
-    return (
-        "[dim]Press [bold]n[/bold] for next,"
-        " [bold]p[/bold] for previous, [bold]q[/bold] to quit[/dim]"
-    )
+        return PAGINATION_PROMPT_LAST
+    return PAGINATION_PROMPT_MIDDLE
 
 
 def _handle_pagination_input(
@@ -575,7 +581,15 @@ def _safe_str(value: Any) -> str:
     Returns:
         String representation, empty string for NA/None values.
     """
-    if pd.isna(value):
+    if value is None:
+        return ""
+    # NaN and NaT are the only scalars unequal to themselves. pandas.NA compares
+    # to NA, which has no truth value. Checked here without importing pandas,
+    # since this runs for every table cell.
+    try:
+        if value != value:  # noqa: PLR0124
+            return ""
+    except TypeError:
         return ""
     return str(value)
 
@@ -584,8 +598,8 @@ class TransactionDisplay:
     """Rich display utilities for transaction data."""
 
     def __init__(self) -> None:
-        """Initialize the transaction display."""
-        self.console = Console()
+        """Initialize the transaction display with the shared CLI console."""
+        self.console = console
 
     def _format_amount_display(self, amount: float, action: str) -> str:
         """Format amount with color based on action type.
@@ -597,11 +611,13 @@ class TransactionDisplay:
         Returns:
             Formatted amount string with color markup
         """
-        amount_str = "0.00" if pd.isna(amount) else f"{float(amount):,.2f}"
+        if math.isnan(amount):
+            amount = 0.0
+        amount_str = f"{amount:,.2f}"
 
-        if action in [Action.SELL, Action.CONTRIBUTION] or amount > 0:
+        if action in INFLOW_ACTIONS or amount > 0:
             return f"[green]{amount_str}[/green]"
-        if action in [Action.BUY, Action.WITHDRAWAL] or amount < 0:
+        if action in OUTFLOW_ACTIONS or amount < 0:
             return f"[red]{amount_str}[/red]"
         return f"[white]{amount_str}[/white]"
 
@@ -641,8 +657,9 @@ class TransactionDisplay:
             console_print("[yellow]No transactions to display[/yellow]")
             return None
 
-        display_df = df.head(max_rows)
-        truncated = len(df) > max_rows
+        total_rows = len(df)
+        truncated = total_rows > max_rows
+        display_df = df.head(max_rows) if truncated else df
 
         table = Table(
             title=title,
@@ -670,7 +687,8 @@ class TransactionDisplay:
 
         if truncated:
             console_print(
-                f"\n[dim]... showing first {max_rows} of {len(df)} transactions[/dim]",
+                f"\n[dim]... showing first {max_rows} of {total_rows}"
+                " transactions[/dim]",
             )
 
         return None
@@ -886,12 +904,17 @@ class TransactionDisplay:
         - Imported: green if matches tally, red with yellow tally if mismatch
         """
         parts: list[str] = []
+        flow = results.flow_summary()
+        read_count = flow["Read"]
+        merge_candidates = flow["Merge Candidates"]
+        merged_into = flow["Merged Into"]
+        excluded = flow["Excluded"]
+        intra = flow["Intra Rejected"]
+        db = flow["DB Rejected"]
+        imported = flow["Imported"]
 
-        read_count = results.read_count()
         parts.append(f"[bold]Read:[/bold] [green]{read_count}[/green]")
 
-        merge_candidates = results.merge_candidates()
-        merged_into = results.merged_into()
         if merge_candidates > 0:
             # X red → Y green (no spaces around arrow, arrow in white)
             parts.append(
@@ -899,12 +922,9 @@ class TransactionDisplay:
                 f"[green]{merged_into}[/green]",
             )
 
-        excluded = results.excluded_count()
         if excluded > 0:
             parts.append(f"[bold]Excluded:[/bold] [red]{excluded}[/red]")
 
-        intra = results.intra_rejected_count()
-        db = results.db_rejected_count()
         if intra > 0 or db > 0:
             dupe_parts = []
             if intra > 0:
@@ -918,7 +938,6 @@ class TransactionDisplay:
         expected_imported = read_count + merge_delta - excluded - intra - db
 
         # Import summary with color coding
-        imported = results.imported_count()
         if imported == expected_imported:
             parts.append(f"[bold]Imported:[/bold] [green]{imported}[/green]")
         else:
@@ -1337,6 +1356,8 @@ class ProgressDisplay:
         Returns:
             Progress instance configured with a spinner
         """
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
         progress = Progress(
             SpinnerColumn(style=color),
             TextColumn(f"[{color}]{{task.description}}[/{color}]"),
@@ -1363,6 +1384,14 @@ class ProgressDisplay:
         Yields:
             Progress instance configured with a progress bar.
         """
+        from rich.progress import (
+            BarColumn,
+            Progress,
+            TaskProgressColumn,
+            TextColumn,
+            TimeRemainingColumn,
+        )
+
         progress = Progress(
             TextColumn(f"[{color}]{{task.description}}[/{color}]"),
             BarColumn(complete_style=color),
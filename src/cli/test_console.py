@@ -26,10 +26,20 @@ class TestConsole:
             legacy_windows=True,  # Ensures no legacy ANSI codes on Windows
             width=120,  # Standardized width for consistent test output
         )
+        self._text = ""
+        self._text_pos = 0
 
     def get_text(self) -> str:
-        """Get the captured plain text output."""
-        return self.file.getvalue()
+        """Get the captured plain text output.
+
+        The console only appends to the buffer, so the text is rebuilt only when
+        the write position has moved since the previous call.
+        """
+        pos = self.file.tell()
+        if pos != self._text_pos:
+            self._text = self.file.getvalue()
+            self._text_pos = pos
+        return self._text
 
 
 @contextmanager
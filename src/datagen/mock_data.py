@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import logging
-import random
+import zlib
 from datetime import datetime, timedelta
 
+import numpy as np
 import pandas as pd
 
 from db import ActionValidationRules
@@ -14,6 +15,11 @@ from utils import TORONTO_TZ, TXN_ESSENTIALS, Action, Column, Currency
 logger = logging.getLogger(__name__)
 SEED_DATE: datetime = datetime(2025, 10, 1, tzinfo=TORONTO_TZ)
 DEFAULT_TXN_COUNT: int = 12
+# Rule lookups are per action, not per transaction, so resolve them once.
+_RULES_BY_ACTION: dict[Action, dict[str, list[str]]] = {
+    action: ActionValidationRules.get_rules_for_action(action.value)
+    for action in Action
+}
 
 
 def get_mock_data_date_range(
@@ -45,48 +51,49 @@ def generate_transactions(
     Returns:
         pd.DataFrame: A DataFrame with the mock transactions.
     """
-    random.seed(ticker)  # Deterministic per ticker.
-    end_date: datetime = SEED_DATE
-    transactions = []
-    actions = list(Action)
-    currencies = list(Currency)
-    for i in range(num_transactions):
-        action = actions[i % len(actions)]
-        currency = currencies[i % len(currencies)]
-        rules = ActionValidationRules.get_rules_for_action(action.value)
-        txn_date = (end_date - timedelta(days=(num_transactions - i) * 7)).strftime(
-            "%Y-%m-%d",
-        )
-        price = round(random.uniform(10, 500), 2)  # noqa: S311
-        units = round(random.uniform(1, 100), 2)  # noqa: S311
-        amount = price * units
-        amount = round(amount, 10)  # db schema supports up to 10 decimal places
-
-        if action in [Action.BUY, Action.WITHDRAWAL]:
-            amount = -amount
-        elif action in [Action.SELL]:
-            units = -units
-        elif action in [Action.FXT, Action.FCH]:
-            amount = random.choice([-1, 1]) * amount  # noqa: S311
-
-        # Start with all fields present
-        transaction = {
-            Column.Txn.TXN_DATE: txn_date,
-            Column.Txn.ACTION: action,
-            Column.Txn.AMOUNT: amount,
-            Column.Txn.CURRENCY: currency,
-            Column.Txn.PRICE: price,
+    # Deterministic per ticker; crc32 since hash() is salted per process.
+    rng = np.random.default_rng(zlib.crc32(ticker.encode()))
+    actions = np.array(list(Action), dtype=object)
+    currencies = np.array(list(Currency), dtype=object)
+    positions = np.arange(num_transactions)
+    action_idx = positions % len(actions)
+    txn_actions = actions[action_idx]
+
+    txn_dates = (
+        np.datetime64(SEED_DATE.date(), "D")
+        - (num_transactions - positions) * np.timedelta64(7, "D")
+    ).astype(str)
+    prices = rng.uniform(10, 500, num_transactions).round(2)
+    units = rng.uniform(1, 100, num_transactions).round(2)
+    # db schema supports up to 10 decimal places
+    amounts = (prices * units).round(10)
+    signs = rng.choice([-1, 1], num_transactions)
+
+    amounts[np.isin(txn_actions, [Action.BUY, Action.WITHDRAWAL])] *= -1
+    units[txn_actions == Action.SELL] *= -1
+    fx_mask = np.isin(txn_actions, [Action.FXT, Action.FCH])
+    amounts[fx_mask] *= signs[fx_mask]
+
+    # Start with all fields present
+    df = pd.DataFrame(
+        {
+            Column.Txn.TXN_DATE: txn_dates.astype(object),
+            Column.Txn.ACTION: txn_actions,
+            Column.Txn.AMOUNT: amounts,
+            Column.Txn.CURRENCY: currencies[positions % len(currencies)],
+            Column.Txn.PRICE: prices,
             Column.Txn.UNITS: units,
             Column.Txn.TICKER: ticker,
             Column.Txn.ACCOUNT: "MOCK-ACCOUNT",
-        }
-
-        # For some transactions, purposely omit optionals to simulate real data and
-        # test validation.
-        if rules["optional_fields"]:
-            for field in rules["optional_fields"]:
-                transaction[getattr(Column.Txn, field.upper())] = None
-
-        transactions.append(transaction)
-
-    return pd.DataFrame(transactions, columns=TXN_ESSENTIALS)
+        },
+        columns=TXN_ESSENTIALS,
+    )
+
+    # For some transactions, purposely omit optionals to simulate real data and
+    # test validation.
+    for idx, action in enumerate(actions):
+        for field in _RULES_BY_ACTION[action]["optional_fields"]:
+            if field in df.columns:
+                df.loc[action_idx == idx, field] = None
+
+    return df
@@ -22,6 +22,7 @@ from db.queries import (
     get_rows,
     get_tables,
     insert_or_replace,
+    invalidate_column_cache,
     update_rows,
 )
 from db.schema import create_fx_table, create_ticker_aliases_table, create_txns_table
@@ -44,6 +45,7 @@ __all__ = [
     "get_tables",
     "helpers",
     "insert_or_replace",
+    "invalidate_column_cache",
     "prepare_transactions",
     "queries",
     "schema",
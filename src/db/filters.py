@@ -2,33 +2,69 @@
 
 from __future__ import annotations
 
-import hashlib
 import logging
 import sqlite3
-from typing import TYPE_CHECKING
+from itertools import batched
+from typing import TYPE_CHECKING, ClassVar
 
+import numpy as np
 import pandas as pd
 
 from app import get_config
-from db.helpers import format_transaction_summary
-from db.queries import get_connection  # circular import fix
-from utils import TXN_ESSENTIALS, Table, get_import_logger
+from db.helpers import format_transaction_summaries
+from db.queries import (  # circular import fix
+    get_connection,
+    get_max_value,
+    get_min_value,
+)
+from utils import (
+    TXN_ESSENTIALS,
+    TXN_NUMERIC_ESSENTIALS,
+    Column,
+    Table,
+    get_import_logger,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from logging import Logger
+    from pathlib import Path
 
 import_logger: Logger = get_import_logger()
+# Dates bound per query when looking up existing transactions, well under
+# SQLite's host parameter limit.
+DATE_LOOKUP_BATCH: int = 500
+# Existing rows fetched and hashed at a time
+KEY_FETCH_ROWS: int = 10_000
+# Essential columns of existing transactions, followed by the date placeholders
+_essential_columns_sql = ", ".join(f'"{col}"' for col in TXN_ESSENTIALS)
+SELECT_ESSENTIALS_BY_DATE_SQL: str = (
+    f"SELECT {_essential_columns_sql} "
+    f'FROM "{Table.TXNS}" WHERE "{Column.Txn.TXN_DATE}" IN'
+)
+# Whole floats below this are exact in float64 and fit in int64
+MAX_EXACT_INT: int = 2**53
 
 
 class TransactionFilter:
     """Class to filter out duplicate transactions."""
 
+    # Keys of existing transactions per TxnDate for the last database read,
+    # keyed by its path with the _db_signature they were read at. Any write to
+    # the database changes the signature and drops the entry.
+    _key_cache: ClassVar[dict[Path, tuple[tuple[int, ...], dict[str, np.ndarray]]]] = {}
+
     @staticmethod
-    def filter_db_duplicates(txn_df: pd.DataFrame) -> pd.DataFrame:
+    def filter_db_duplicates(
+        txn_df: pd.DataFrame,
+        keys: pd.Series | None = None,
+    ) -> pd.DataFrame:
         """Filter out transactions that already exist in the database.
 
         Args:
             txn_df: DataFrame with transaction data.
+            keys: Keys from generate_keys for txn_df, or for a frame txn_df was
+                filtered from, matched to rows by index. Generated if omitted.
 
         Returns:
             DataFrame with database duplicates removed, unless approved.
@@ -36,24 +72,28 @@ class TransactionFilter:
         if txn_df.empty:  # pragma: no cover
             return txn_df
 
-        existing_keys = TransactionFilter._get_db_transaction_keys()
-        if not existing_keys:
-            return txn_df
-
-        new_keys_series: pd.Series[str] = TransactionFilter._generate_keys(
-            txn_df,
+        new_keys_series: pd.Series[int] = (
+            TransactionFilter.generate_keys(txn_df)
+            if keys is None
+            else keys.reindex(txn_df.index)
+        )
+        new_keys = new_keys_series.unique()
+        # Same normalization generate_keys applies to the date column
+        txn_dates = txn_df[Column.Txn.TXN_DATE].dropna().astype(str).str.strip()
+        duplicates = TransactionFilter._get_db_transaction_keys(
+            txn_dates.unique(),
+            new_keys,
         )
-        new_keys: set[str] = set(new_keys_series)
         import_logger.debug(
-            "CHECK duplicates: %d existing keys, %d new keys",
-            len(existing_keys),
+            "CHECK duplicates: %d new keys, %d already in database",
             len(new_keys),
+            len(duplicates),
         )
-        duplicates: set[str] = existing_keys & new_keys
-        if not duplicates:  # pragma: no cover
+        if duplicates.empty:
             return txn_df
 
         is_duplicate: pd.Series[bool] = new_keys_series.isin(duplicates)
+
         approved_mask, rejected_mask = TransactionFilter._process_duplicate_approval(
             txn_df,
             is_duplicate,
@@ -66,16 +106,22 @@ class TransactionFilter:
             duplicate_type="database",
         )
 
-        # Return all non-duplicates plus approved duplicates
+        # Return all non-duplicates plus approved duplicates. take() already
+        # returns a new frame that is not flagged as a copy of txn_df, so no
+        # extra .copy() is needed before callers add columns to it.
         keep_mask = ~is_duplicate | approved_mask
-        return txn_df[keep_mask].copy()
+        return txn_df.take(np.flatnonzero(keep_mask))
 
     @staticmethod
-    def filter_intra_import_duplicates(txn_df: pd.DataFrame) -> pd.DataFrame:
+    def filter_intra_import_duplicates(
+        txn_df: pd.DataFrame,
+        keys: pd.Series | None = None,
+    ) -> pd.DataFrame:
         """Filter out duplicate transactions within the DataFrame itself.
 
         Args:
             txn_df: DataFrame with transaction data.
+            keys: Keys from generate_keys for txn_df. Generated if omitted.
 
         Returns:
             DataFrame with duplicates removed, unless approved.
@@ -83,8 +129,8 @@ class TransactionFilter:
         if txn_df.empty:  # pragma: no cover
             return txn_df
 
-        # Use vectorized key generation
-        keys = TransactionFilter._generate_keys(txn_df)
+        if keys is None:
+            keys = TransactionFilter.generate_keys(txn_df)
         duplicate_mask = keys.duplicated(keep=False)
         num_dupes = duplicate_mask.sum()
 
@@ -105,7 +151,72 @@ class TransactionFilter:
 
         # Keep non-duplicates and approved duplicates
         keep_mask = ~duplicate_mask | approved_mask
-        return txn_df[keep_mask].copy()
+        return txn_df.take(np.flatnonzero(keep_mask))
+
+    @staticmethod
+    def generate_keys(txn_df: pd.DataFrame) -> pd.Series:
+        """Generate synthetic primary keys based on TXN_ESSENTIALS.
+
+        This method processes the entire DataFrame columnwise and generates synthetic
+        key representations for all rows.
+
+        Args:
+            txn_df: DataFrame with transaction data
+
+        Returns:
+            Series of uint64 keys hashed from the normalized essential columns
+        """
+        if txn_df.empty:  # pragma: no cover
+            return pd.Series([], dtype=np.uint64)
+
+        normalized_cols: dict[str, pd.Series] = {}
+        for col in TXN_ESSENTIALS:
+            col_series = txn_df[col].fillna("")
+            normalized = col_series.astype(str)
+            if col not in TXN_NUMERIC_ESSENTIALS:
+                # Text columns are hashed as written, even if they look numeric
+                normalized_cols[col] = normalized.str.strip()
+                continue
+
+            numeric_series = pd.to_numeric(col_series, errors="coerce")
+            numeric_mask = ~numeric_series.isna()
+
+            if numeric_mask.any():
+                normalized.loc[numeric_mask] = TransactionFilter._normalize_numeric(
+                    numeric_series[numeric_mask].to_numpy(dtype=float),
+                )
+
+            normalized_cols[col] = normalized.str.strip()
+
+        # Keys only need to be stable and well spread within this process, not
+        # cryptographic. hash_pandas_object hashes each column in C with a fixed
+        # key and combines them per row into a uint64.
+        return pd.util.hash_pandas_object(pd.DataFrame(normalized_cols), index=False)
+
+    @staticmethod
+    def _normalize_numeric(values: np.ndarray) -> np.ndarray:
+        """Format numbers to 8 decimals with trailing zeros stripped.
+
+        Whole numbers, common for units and prices, skip the float formatting
+        and are written as integers directly.
+
+        Args:
+            values: float64 array without NaN
+
+        Returns:
+            Array of normalized strings, in order
+        """
+        whole = (values == np.round(values)) & (np.abs(values) < MAX_EXACT_INT)
+        normalized = np.empty(len(values), dtype=object)
+        normalized[whole] = values[whole].astype(np.int64).astype(str)
+        formatted = np.char.mod("%.8f", values[~whole])
+        normalized[~whole] = np.char.rstrip(np.char.rstrip(formatted, "0"), ".")
+        return normalized
+
+    @classmethod
+    def invalidate_key_cache(cls) -> None:
+        """Forget cached keys of existing transactions."""
+        cls._key_cache.clear()
 
     @staticmethod
     def _process_duplicate_approval(
@@ -124,25 +235,19 @@ class TransactionFilter:
         config = get_config()
         approval_column = config.duplicate_approval_column
         approval_value = config.duplicate_approval_value
-        approved_mask = pd.Series([False] * len(txn_df), index=txn_df.index)
-        rejected_mask = pd.Series([False] * len(txn_df), index=txn_df.index)
 
         if approval_column not in txn_df.columns:
             # No approval column, all duplicates are rejected
-            rejected_mask.loc[txn_df[duplicate_mask].index] = True
-            return approved_mask, rejected_mask
+            approved_mask = pd.Series(data=False, index=txn_df.index)
+            return approved_mask, duplicate_mask.copy()
 
         # Check which duplicates are approved
-        duplicate_indices = txn_df[duplicate_mask].index
-        for idx in duplicate_indices:
-            approval_cell_value = txn_df.loc[idx, approval_column]
-            is_approved: bool = (
-                pd.notna(approval_cell_value)
-                and str(approval_cell_value).strip().upper() == approval_value.upper()
-            )
-
-            (approved_mask if is_approved else rejected_mask).loc[idx] = True
-
+        approval_cells = txn_df[approval_column]
+        is_approved = approval_cells.notna() & (
+            approval_cells.astype(str).str.strip().str.upper() == approval_value.upper()
+        )
+        approved_mask = duplicate_mask & is_approved
+        rejected_mask = duplicate_mask & ~is_approved
         return approved_mask, rejected_mask
 
     @staticmethod
@@ -167,9 +272,8 @@ class TransactionFilter:
             import_logger.info(msg)
 
             if import_logger.isEnabledFor(logging.INFO):
-                approved_summaries = txn_df[approved_mask].apply(
-                    format_transaction_summary,
-                    axis=1,
+                approved_summaries = format_transaction_summaries(
+                    txn_df[approved_mask],
                 )
                 for summary in approved_summaries:
                     import_logger.info(" * %s", summary)
@@ -181,83 +285,141 @@ class TransactionFilter:
             import_logger.warning(msg)
 
             if import_logger.isEnabledFor(logging.WARNING):
-                rejected_summaries = txn_df[rejected_mask].apply(
-                    format_transaction_summary,
-                    axis=1,
+                rejected_summaries = format_transaction_summaries(
+                    txn_df[rejected_mask],
                 )
                 for summary in rejected_summaries:
                     import_logger.warning(" - %s", summary)
 
     @staticmethod
-    def _generate_keys(txn_df: pd.DataFrame) -> pd.Series:
-        """Generate synthetic primary keys based on TXN_ESSENTIALS.
-
-        This method processes the entire DataFrame columnwise and generates synthetic
-        key representations for all rows.
+    def _get_db_transaction_keys(
+        txn_dates: Iterable[str],
+        candidate_keys: np.ndarray,
+    ) -> pd.Index:
+        """Get which candidate keys already exist in the database.
+
+        The transaction date is part of every key, so only rows sharing a date
+        with the import can be duplicates. Those are read through the TxnDate
+        index instead of scanning the whole table, and dates outside the range
+        already stored are not looked up at all. Keys read for a date are kept
+        until the database is written to, so repeated lookups only read and hash
+        dates they have not seen yet.
 
         Args:
-            txn_df: DataFrame with transaction data
+            txn_dates: Distinct transaction dates of the rows being imported.
+            candidate_keys: Distinct synthetic keys of the rows being imported.
 
         Returns:
-            Series of hash strings representing synthetic primary keys
+            Index of candidate keys found among existing transactions.
         """
-        if txn_df.empty:  # pragma: no cover
-            return pd.Series([], dtype=str)
+        no_keys = pd.Index([], dtype=np.uint64)
+        db_path = get_config().db_path
+        with get_connection() as conn:
+            try:
+                signature = TransactionFilter._db_signature(conn, db_path)
+                if signature[0] == 0:
+                    return no_keys
+                cached = TransactionFilter._key_cache.get(db_path)
+                if cached is not None and cached[0] == signature:
+                    keys_by_date = cached[1]
+                else:
+                    keys_by_date = {}
+                    TransactionFilter._key_cache.clear()
+                    TransactionFilter._key_cache[db_path] = (signature, keys_by_date)
+
+                db_min = get_min_value(conn, Table.TXNS, Column.Txn.TXN_DATE)
+                db_max = get_max_value(conn, Table.TXNS, Column.Txn.TXN_DATE)
+                if db_min is None or db_max is None:  # pragma: no cover
+                    return no_keys
+                # Dates are YYYY-MM-DD text, so string order is date order
+                txn_dates = [date for date in txn_dates if db_min <= date <= db_max]
+                TransactionFilter._read_date_keys(
+                    conn,
+                    [date for date in txn_dates if date not in keys_by_date],
+                    keys_by_date,
+                )
+            except sqlite3.Error:
+                import_logger.debug(
+                    "Table '%s' does not exist yet, no existing transactions to check.",
+                    Table.TXNS,
+                )
+                return no_keys
 
-        normalized_cols = []
-        for col in TXN_ESSENTIALS:
-            col_series = txn_df[col].fillna("")
-            numeric_series = pd.to_numeric(col_series, errors="coerce")
-            numeric_mask = ~numeric_series.isna()
-            normalized = col_series.astype(str)
+        if not txn_dates:
+            return no_keys
+        existing_keys = np.concatenate([keys_by_date[date] for date in txn_dates])
+        return pd.Index(
+            existing_keys[pd.Index(existing_keys).isin(candidate_keys)],
+        ).unique()
 
-            # For numeric values, format to 8 decimals and strip trailing zeros
-            if numeric_mask.any():
-                formatted_numeric = numeric_series[numeric_mask].apply(
-                    lambda x: f"{x:.8f}".rstrip("0").rstrip("."),
-                )
-                normalized.loc[numeric_mask] = formatted_numeric
+    @staticmethod
+    def _db_signature(conn: sqlite3.Connection, db_path: Path) -> tuple[int, ...]:
+        """Return values that change whenever the database is written to.
 
-            normalized = normalized.str.strip()
-            normalized_cols.append(normalized)
+        The row count and max rowid of Txns catch appends and deletes. The size
+        and timestamps of the database and its WAL file catch in-place edits and
+        the file being replaced, e.g. by a backup with the same rows.
 
-        # Concatenate all columns with separator
-        key_string = normalized_cols[0].astype(str)
-        for col_series in normalized_cols[1:]:
-            key_string = key_string + "|" + col_series.astype(str)
+        Args:
+            conn: Database connection
+            db_path: Path of the database file
 
-        return key_string.apply(
-            lambda x: hashlib.sha256(x.encode("utf-8")).hexdigest(),
-        )
+        Returns:
+            Tuple starting with the row count of Txns
+        """
+        row_count, max_rowid = conn.execute(
+            f'SELECT COUNT(*), COALESCE(MAX(rowid), 0) FROM "{Table.TXNS}"',
+        ).fetchone()
+        db_stat = db_path.stat()
+        signature = [
+            row_count,
+            max_rowid,
+            db_stat.st_size,
+            db_stat.st_mtime_ns,
+            db_stat.st_ctime_ns,
+        ]
+        # The WAL file is recreated empty by each first connection, so only its
+        # contents are compared, not its timestamps while empty.
+        wal_path = db_path.with_name(f"{db_path.name}-wal")
+        wal_stat = wal_path.stat() if wal_path.exists() else None
+        if wal_stat is not None and wal_stat.st_size > 0:
+            signature.extend((wal_stat.st_size, wal_stat.st_mtime_ns))
+        return tuple(signature)
 
     @staticmethod
-    def _get_db_transaction_keys() -> set[str]:
-        """Get synthetic keys for all existing transactions in the database.
+    def _read_date_keys(
+        conn: sqlite3.Connection,
+        txn_dates: list[str],
+        keys_by_date: dict[str, np.ndarray],
+    ) -> None:
+        """Hash existing transactions on the given dates into keys_by_date.
 
         Args:
-            conn: Database connection.
-
-        Returns:
-            Set of synthetic keys for existing transactions.
+            conn: Database connection
+            txn_dates: Dates to read, every one gets an entry even without rows
+            keys_by_date: Cache of uint64 keys per transaction date to fill in
         """
-        with get_connection() as conn:
-            try:
-                # Build the query to select essential columns.
-                essential_cols = ", ".join(f'"{col}"' for col in TXN_ESSENTIALS)
-                query = f'SELECT {essential_cols} FROM "{Table.TXNS}"'
-                existing_df = pd.read_sql_query(query, conn)
-                if existing_df.empty:  # pragma: no cover
-                    return set()
-
-                existing_keys_series = TransactionFilter._generate_keys(
-                    existing_df,
-                )
-                existing_keys: set[str] = set(existing_keys_series)
-            except (sqlite3.Error, pd.errors.DatabaseError):
-                import_logger.debug(
-                    "Table '%s' does not exist yet, no existing transactions to check.",
-                    Table.TXNS,
+        date_keys: dict[str, list[np.ndarray]] = {date: [] for date in txn_dates}
+        for dates in batched(txn_dates, DATE_LOOKUP_BATCH, strict=False):
+            cursor = conn.execute(
+                f"{SELECT_ESSENTIALS_BY_DATE_SQL} ({', '.join('?' * len(dates))})",
+                dates,
+            )
+            # Hash in bounded chunks rather than holding every row at once
+            while rows := cursor.fetchmany(KEY_FETCH_ROWS):
+                chunk_df = pd.DataFrame.from_records(
+                    rows,
+                    columns=TXN_ESSENTIALS,
+                    coerce_float=True,
                 )
-                return set()
-            else:
-                return existing_keys
+                chunk_keys = TransactionFilter.generate_keys(chunk_df)
+                for date, keys in chunk_keys.groupby(
+                    chunk_df[Column.Txn.TXN_DATE].to_numpy(),
+                    sort=False,
+                ):
+                    date_keys[date].append(keys.to_numpy())
+
+        for date, parts in date_keys.items():
+            keys_by_date[date] = (
+                np.concatenate(parts) if parts else np.empty(0, dtype=np.uint64)
+            )
@@ -4,23 +4,64 @@ from __future__ import annotations
 
 import logging
 import re
+from collections import defaultdict
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
-from typing import ClassVar
+from typing import TYPE_CHECKING, ClassVar
 
+import numpy as np
 import pandas as pd
 
 from app import get_config
-from db.helpers import format_transaction_summary
+from db.helpers import format_transaction_summaries
 from utils import TORONTO_TZ, Action, Column, Currency, get_import_logger
 from utils.optional_fields import FieldType
 from utils.settlement_calculator import settlement_calculator
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection
+
 logger = logging.getLogger(__name__)
 import_logger = get_import_logger()
-actions: list[str] = [action.value for action in Action]
-currencies: set[str] = {currency.value for currency in Currency}
+actions: frozenset[str] = frozenset(action.value for action in Action)
+currencies: frozenset[str] = frozenset(currency.value for currency in Currency)
 AUTO_FORMAT_DEBUG: str = "%d - Auto-formatted %s: '%s' -> '%s'"
+# Larger imports are formatted in row chunks of this size, so each column pass
+# works on a slice that stays in cache across the formatting steps
+FORMAT_CHUNK_ROWS: int = 50_000
+# Dates parse_date returns without strptime: YYYY-MM-DD, optionally followed by
+# an ISO 8601 or space separated time. Group 1 is the date.
+ISO_DATE_PATTERN = re.compile(
+    r"^(\d{4}-\d{2}-\d{2})"
+    r"(?:T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:\d{2})?"
+    r"|\s+\d{2}:\d{2}:\d{2}(?:\.\d+)?)?$",
+)
+# Upper-cased tickers, e.g. "AAPL", "RY.TO" or "REI-UN.TO"
+TICKER_PATTERN = re.compile(r"[A-Z0-9.-]+")
+# Currency signs and thousands separators dropped from numbers
+NUMBER_SYMBOLS_PATTERN = re.compile(r"[$,]")
+# Numbers already written the way _to_decimal_format would write them
+PLAIN_DECIMAL_PATTERN = re.compile(r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?")
+# Other date formats parse_date tries, in order
+DATE_FORMATS: tuple[str, ...] = (
+    "%Y-%m-%d",  # 2023-01-15
+    "%m/%d/%Y",  # 01/15/2023
+    "%d/%m/%Y",  # 15/01/2023
+    "%m-%d-%Y",  # 01-15-2023
+    "%d-%m-%Y",  # 15-01-2023
+    "%Y/%m/%d",  # 2023/01/15
+    "%d.%m.%Y",  # 15.01.2023
+    "%m.%d.%Y",  # 01.15.2023
+    "%B %d, %Y",  # January 15, 2023
+    "%b %d, %Y",  # Jan 15, 2023
+    "%d %B %Y",  # 15 January 2023
+    "%d %b %Y",  # 15 Jan 2023
+)
+# DATE_FORMATS paired with the separator a date string must contain to match.
+# A space in a format matches any run of whitespace.
+DATE_FORMAT_SEPARATORS: tuple[tuple[str, str], ...] = tuple(
+    (next(char for char in fmt if char in "-/. "), fmt) for fmt in DATE_FORMATS
+)
 
 
 class ActionValidationRules:
@@ -139,6 +180,30 @@ def _to_decimal_format(value: str) -> str | None:
         return None
 
 
+def _to_decimal_formats(values: pd.Series) -> pd.Series:
+    """Apply _to_decimal_format to a Series of stripped strings.
+
+    Values already written as plain decimals are kept as they are, which is what
+    _to_decimal_format returns for them, so only the rest go through Decimal.
+    """
+    formatted = values.astype(object)
+    other_mask = ~values.str.fullmatch(PLAIN_DECIMAL_PATTERN)
+    if other_mask.any():
+        formatted[other_mask] = values[other_mask].map(_to_decimal_format)
+    return formatted
+
+
+def _normalize_choices(
+    values: pd.Series,
+    aliases: dict[str, str],
+    choices: Collection[str],
+) -> pd.Series:
+    """Upper-case values and resolve aliases, missing where not one of choices."""
+    upper_series = values.astype(str).str.strip().str.upper()
+    normalized_series = upper_series.map(aliases).fillna(upper_series)
+    return normalized_series.where(normalized_series.isin(choices))
+
+
 class TransactionFormatter:
     """Formatter for transaction data before database insertion."""
 
@@ -181,11 +246,24 @@ class TransactionFormatter:
             df: DataFrame with transaction data
         """
         self.original_df = df
-        self.formatted_df = df.copy()
-        self.exclusions: list[int] = []
-        self.rejection_reasons: dict[int, list[str]] = {}
+        # Shares data with df: formatting replaces whole columns, and columns
+        # written row by row are copied first in _format_rule_columns
+        self.formatted_df = df.copy(deep=False)
+        self.exclusions: set[int] = set()
+        self.rejection_reasons: defaultdict[int, list[str]] = defaultdict(list)
         self.config = get_config()
         self.excluded_df = pd.DataFrame()
+        # Columns configured as optional fields, by type, in column order
+        self.optional_columns: dict[FieldType, list[str]] = {}
+        optional_fields = self.config.optional_fields
+        if optional_fields:
+            for column in self.formatted_df.columns:
+                optional_field = optional_fields.get_field(column)
+                if optional_field:
+                    self.optional_columns.setdefault(
+                        optional_field.field_type,
+                        [],
+                    ).append(column)
 
     @staticmethod
     def format_and_validate(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
@@ -206,32 +284,82 @@ class TransactionFormatter:
 
     def _process(self) -> None:
         """Process the transaction data through all formatting steps."""
-        original_df = self.formatted_df.copy(deep=True)
+        if len(self.original_df) > FORMAT_CHUNK_ROWS:
+            self._format_in_chunks()
+        else:
+            self._format_columns()
+        self._finalize_exclusions()
+        # original_df is never modified, formatted_df only shares its data
+        self._log_formatting_changes(self.original_df)
+        self._calculate_settlement_dates()
+
+    def _format_columns(self) -> None:
+        """Format and validate every column of formatted_df."""
         self._format_dates()
         self._format_actions()
         self._format_currencies()
         self._format_rule_columns()
-        self._finalize_exclusions()
-        self._log_formatting_changes(original_df)
-        self._calculate_settlement_dates()
+
+    def _format_in_chunks(self) -> None:
+        """Format and validate columns FORMAT_CHUNK_ROWS rows at a time.
+
+        Exclusions of every chunk are collected here, so they are finalized and
+        logged once for the whole DataFrame.
+        """
+        formatted_chunks = []
+        for start in range(0, len(self.original_df), FORMAT_CHUNK_ROWS):
+            chunk = TransactionFormatter(
+                self.original_df.iloc[start : start + FORMAT_CHUNK_ROWS],
+            )
+            chunk._format_columns()
+            formatted_chunks.append(chunk.formatted_df)
+            self.exclusions.update(chunk.exclusions)
+            for idx, reasons in chunk.rejection_reasons.items():
+                self.rejection_reasons[idx].extend(reasons)
+        # Concatenated per column, as DataFrame concat turns a column that is all
+        # missing in one chunk into NaN there
+        self.formatted_df = pd.DataFrame(
+            {
+                column: pd.concat([chunk_df[column] for chunk_df in formatted_chunks])
+                for column in formatted_chunks[0].columns
+            },
+        )
+
+    def _reject(self, indices: pd.Index, reason: str) -> None:
+        """Exclude rows from the import and record the reason for each."""
+        self.exclusions.update(indices)
+        for idx in indices:
+            self.rejection_reasons[idx].append(reason)
 
     def _finalize_exclusions(self) -> None:
         """Remove excluded rows and log rejection details."""
         if self.exclusions:
-            excluded_indices = set(self.exclusions)
-            self.excluded_df = self.original_df.loc[list(excluded_indices)].copy()
+            excluded_indices = self.exclusions
+            # In original row order, however the exclusions were collected
+            self.excluded_df = self.original_df[
+                self.original_df.index.isin(excluded_indices)
+            ].copy()
             if not self.excluded_df.empty:
-                reasons_list = []
-                for idx in self.excluded_df.index:
-                    reasons = self.rejection_reasons.get(idx, ["Unknown"])
-                    reasons_list.append("; ".join(reasons))
+                joined_reasons = pd.Series(
+                    {
+                        idx: "; ".join(reasons)
+                        for idx, reasons in self.rejection_reasons.items()
+                    },
+                    dtype=object,
+                )
+                reasons_series = joined_reasons.reindex(self.excluded_df.index)
                 self.excluded_df = self.excluded_df.assign(
-                    **{str(Column.REJECTION_REASON): reasons_list},
+                    **{
+                        str(Column.REJECTION_REASON): reasons_series.fillna(
+                            "Unknown",
+                        ).to_numpy(),
+                    },
                 )
 
-            self.formatted_df = self.formatted_df[
-                ~self.formatted_df.index.isin(excluded_indices)
-            ]
+            self.formatted_df = self.formatted_df.drop(
+                index=list(excluded_indices),
+                errors="ignore",
+            )
 
             if not import_logger.isEnabledFor(logging.WARNING):  # pragma: no cover
                 return
@@ -242,16 +370,11 @@ class TransactionFormatter:
                 excluded_count,
             )
 
-            for idx in sorted(excluded_indices):
-                if idx < len(self.original_df):
-                    row = self.original_df.iloc[idx]
-                    reasons = self.rejection_reasons.get(idx, ["Unknown reason"])
-                    reason_str = ", ".join(reasons)
-                    import_logger.warning(
-                        " - %s (%s)",
-                        format_transaction_summary(row),
-                        reason_str,
-                    )
+            logged_df = self.excluded_df.sort_index()
+            summaries = format_transaction_summaries(logged_df)
+            for idx, summary in zip(logged_df.index, summaries, strict=True):
+                reasons = self.rejection_reasons.get(idx, ["Unknown reason"])
+                import_logger.warning(" - %s (%s)", summary, ", ".join(reasons))
 
     def _log_formatting_changes(
         self,
@@ -265,40 +388,29 @@ class TransactionFormatter:
         if not import_logger.isEnabledFor(logging.DEBUG):
             return
 
-        try:
-            for column in self.formatted_df.columns:
-                if column not in original_df.columns:
-                    continue
-
-                orig_str = original_df[column].astype(str).fillna("")
-                curr_str = self.formatted_df[column].astype(str).fillna("")
-                changed_mask = orig_str != curr_str
-
-                if changed_mask.any():
-                    for idx in changed_mask[changed_mask].index:
-                        orig_val = (
-                            original_df[column].iloc[idx]
-                            if idx < len(original_df)
-                            else ""
-                        )
-                        curr_val = (
-                            self.formatted_df[column].iloc[idx]
-                            if idx < len(self.formatted_df)
-                            else ""
-                        )
-                        import_logger.debug(
-                            AUTO_FORMAT_DEBUG,
-                            idx,
-                            column,
-                            orig_val,
-                            curr_val,
-                        )
-        except (TypeError, ValueError) as exc:
-            import_logger.warning(
-                "Comparison failed for column '%s' due to error: %s",
-                column,
-                exc,
-            )
+        # Compare the rows and columns that remain, as displayed strings
+        columns = self.formatted_df.columns.intersection(
+            original_df.columns,
+            sort=False,
+        )
+        current = self.formatted_df[columns]
+        original = original_df.loc[current.index, columns]
+        changed = original.astype(str).fillna("").ne(current.astype(str).fillna(""))
+        for column in columns:
+            changed_mask = changed[column].to_numpy()
+            for idx, old_value, new_value in zip(
+                changed.index[changed_mask],
+                original[column].to_numpy()[changed_mask],
+                current[column].to_numpy()[changed_mask],
+                strict=True,
+            ):
+                import_logger.debug(
+                    AUTO_FORMAT_DEBUG,
+                    idx,
+                    column,
+                    old_value,
+                    new_value,
+                )
 
     def _format_dates(self) -> None:
         """Format date columns."""
@@ -307,183 +419,141 @@ class TransactionFormatter:
         if Column.Txn.SETTLE_DATE in self.formatted_df.columns:
             self._format_date_column(Column.Txn.SETTLE_DATE, required=False)
 
-        if self.config.optional_fields:
-            for column in self.formatted_df.columns:
-                optional_field = self.config.optional_fields.get_field(column)
-                if optional_field and optional_field.field_type == FieldType.DATE:
-                    self._format_date_column(column, required=False)
+        for column in self.optional_columns.get(FieldType.DATE, []):
+            self._format_date_column(column, required=False)
 
     def _format_date_column(self, column: str, *, required: bool) -> None:
         """Format all dates for the specified column."""
-        col_series = self.formatted_df[column]
-        if required:
-            missing_mask = col_series.isna()
-            if missing_mask.any():
-                missing_indices = col_series[missing_mask].index
-                self.exclusions.extend(missing_indices)
-                for idx in missing_indices:
-                    reason = f"MISSING {column}"
-                    self.rejection_reasons.setdefault(idx, []).append(reason)
-        else:
-            self.formatted_df.loc[col_series.isna(), column] = pd.NA
-
-        non_missing_mask = col_series.notna()
-        if non_missing_mask.any():
-            non_missing_series = col_series[non_missing_mask]
-            parsed_dates = non_missing_series.apply(parse_date)
-            invalid_mask = parsed_dates.isna()
-
-            if invalid_mask.any():
-                invalid_indices = non_missing_series[invalid_mask].index
-                if required:
-                    self.exclusions.extend(invalid_indices)
-                    for idx in invalid_indices:
-                        reason = f"INVALID {column}"
-                        self.rejection_reasons.setdefault(idx, []).append(reason)
-                else:
-                    for idx in invalid_indices:
-                        value = non_missing_series.loc[idx]
-                        import_logger.debug(
-                            "%d - Invalid optional date field '%s': '%s'",
-                            idx,
-                            column,
-                            value,
-                        )
-
-        valid_parsed_mask = parsed_dates.notna()
-        if valid_parsed_mask.any():
-            valid_indices = non_missing_series[valid_parsed_mask].index
-            self.formatted_df.loc[valid_indices, column] = parsed_dates[
-                valid_parsed_mask
-            ]
+        self._format_column(column, parse_dates, "date", required=required)
 
     def _format_actions(self) -> None:
         """Format action columns."""
         if Column.Txn.ACTION in self.formatted_df.columns:
             self._format_action_column(Column.Txn.ACTION, required=True)
 
-        if self.config.optional_fields:
-            for column in self.formatted_df.columns:
-                optional_field = self.config.optional_fields.get_field(column)
-                if optional_field and optional_field.field_type == FieldType.ACTION:
-                    self._format_action_column(column, required=False)
+        for column in self.optional_columns.get(FieldType.ACTION, []):
+            self._format_action_column(column, required=False)
 
     def _format_action_column(self, column: str, *, required: bool) -> None:
         """Format all actions for the specified column."""
-        col_series = self.formatted_df[column]
-
-        missing_mask = col_series.isna() | (col_series.astype(str).str.strip() == "")
-        if missing_mask.any():
-            missing_indices = col_series[missing_mask].index
-            if required:
-                self.exclusions.extend(missing_indices)
-                for idx in missing_indices:
-                    reason = f"MISSING {column}"
-                    self.rejection_reasons.setdefault(idx, []).append(reason)
-            else:
-                self.formatted_df.loc[missing_indices, column] = pd.NA
-
-        non_missing_mask = ~missing_mask
-        if non_missing_mask.any():
-            non_missing_series = col_series[~missing_mask]
-            action_str_series = non_missing_series.astype(str).str.strip().str.upper()
-            normalized_series = action_str_series.map(self.ACTION_MAP).fillna(
-                action_str_series,
-            )
-
-            valid_actions_mask = normalized_series.isin(actions)
-            invalid_mask = ~valid_actions_mask
-
-            if invalid_mask.any():
-                invalid_indices = non_missing_series[invalid_mask].index
-                if required:
-                    self.exclusions.extend(invalid_indices)
-                    for idx in invalid_indices:
-                        reason = f"INVALID {column}"
-                        self.rejection_reasons.setdefault(idx, []).append(reason)
-                else:
-                    for idx in invalid_indices:
-                        value = non_missing_series.loc[idx]
-                        import_logger.debug(
-                            "%d - Invalid optional action field '%s': '%s'",
-                            idx,
-                            column,
-                            value,
-                        )
-
-        if valid_actions_mask.any():
-            valid_indices = non_missing_series[valid_actions_mask].index
-            self.formatted_df.loc[valid_indices, column] = normalized_series[
-                valid_actions_mask
-            ]
+        self._format_column(
+            column,
+            self._normalize_actions,
+            "action",
+            required=required,
+            blank_is_missing=True,
+        )
 
     def _format_currencies(self) -> None:
         """Format currency columns."""
         if Column.Txn.CURRENCY in self.formatted_df.columns:
             self._format_currency_column(Column.Txn.CURRENCY, required=True)
 
-        if self.config.optional_fields:
-            for column in self.formatted_df.columns:
-                optional_field = self.config.optional_fields.get_field(column)
-                if optional_field and optional_field.field_type == FieldType.CURRENCY:
-                    self._format_currency_column(column, required=False)
+        for column in self.optional_columns.get(FieldType.CURRENCY, []):
+            self._format_currency_column(column, required=False)
 
     def _format_currency_column(self, column: str, *, required: bool) -> None:
-        """Format all."""
+        """Format all currencies for the specified column."""
+        self._format_column(
+            column,
+            self._normalize_currencies,
+            "currency",
+            required=required,
+        )
+
+    def _format_column(
+        self,
+        column: str,
+        normalize: Callable[[pd.Series], pd.Series],
+        field_type: str,
+        *,
+        required: bool,
+        blank_is_missing: bool = False,
+    ) -> None:
+        """Normalize a whole column, excluding or clearing unusable values.
+
+        Missing and invalid values exclude their rows when the column is
+        required. Otherwise missing values become NA and invalid ones are kept
+        as they are.
+
+        Args:
+            column: Column to format
+            normalize: Maps non-missing values to their normalized form, missing
+                where a value is invalid
+            field_type: Kind of field named in debug logs, e.g. "date"
+            required: Whether rows need a valid value in this column
+            blank_is_missing: Treat blank strings as missing rather than invalid
+        """
         col_series = self.formatted_df[column]
-        missing_mask = col_series.isna()
+        updated_series = col_series.copy()
+        missing_mask = col_series.isna().to_numpy()
+        if blank_is_missing:
+            missing_mask |= (col_series.astype(str).str.strip() == "").to_numpy()
         if missing_mask.any():
-            missing_indices = col_series[missing_mask].index
+            missing_indices = col_series.index[missing_mask]
             if required:
-                self.exclusions.extend(missing_indices)
-                for idx in missing_indices:
-                    reason = f"MISSING {column}"
-                    self.rejection_reasons.setdefault(idx, []).append(reason)
+                self._reject(missing_indices, f"MISSING {column}")
             else:
-                self.formatted_df.loc[missing_indices, column] = pd.NA
+                updated_series.loc[missing_indices] = pd.NA
 
-        non_missing_mask = ~missing_mask
-        if non_missing_mask.any():
-            non_missing_series = col_series[~missing_mask]
-            currency_str_series = non_missing_series.astype(str).str.strip().str.upper()
-            normalized_series = currency_str_series.map(self.CURRENCY_MAP).fillna(
-                currency_str_series,
+        non_missing_series = col_series.iloc[np.flatnonzero(~missing_mask)]
+        if non_missing_series.empty:
+            self.formatted_df[column] = updated_series
+            return
+
+        normalized_series = normalize(non_missing_series)
+        invalid_mask = normalized_series.isna().to_numpy()
+        if invalid_mask.any():
+            invalid_indices = non_missing_series.index[invalid_mask]
+            if required:
+                self._reject(invalid_indices, f"INVALID {column}")
+            else:
+                invalid_values = non_missing_series.to_numpy()[invalid_mask]
+                for idx, value in zip(invalid_indices, invalid_values, strict=True):
+                    import_logger.debug(
+                        "%d - Invalid optional %s field '%s': '%s'",
+                        idx,
+                        field_type,
+                        column,
+                        value,
+                    )
+
+        valid_mask = ~invalid_mask
+        if valid_mask.any():
+            updated_series.loc[non_missing_series.index[valid_mask]] = (
+                normalized_series.iloc[valid_mask]
             )
-            valid_currencies_mask = normalized_series.isin(currencies)
-            invalid_mask = ~valid_currencies_mask
+        self.formatted_df[column] = updated_series
 
-            if invalid_mask.any():
-                invalid_indices = non_missing_series[invalid_mask].index
-                if required:
-                    self.exclusions.extend(invalid_indices)
-                    for idx in invalid_indices:
-                        reason = f"INVALID {column}"
-                        self.rejection_reasons.setdefault(idx, []).append(reason)
-                else:
-                    for idx in invalid_indices:
-                        value = non_missing_series.loc[idx]
-                        import_logger.debug(
-                            "%d - Invalid optional currency field '%s': '%s'",
-                            idx,
-                            column,
-                            value,
-                        )
+    @classmethod
+    def _normalize_actions(cls, values: pd.Series) -> pd.Series:
+        """Map action aliases to actions, missing where not a known action."""
+        return _normalize_choices(values, cls.ACTION_MAP, actions)
 
-        if valid_currencies_mask.any():
-            valid_indices = non_missing_series[valid_currencies_mask].index
-            self.formatted_df.loc[valid_indices, column] = normalized_series[
-                valid_currencies_mask
-            ]
+    @classmethod
+    def _normalize_currencies(cls, values: pd.Series) -> pd.Series:
+        """Map currency aliases to codes, missing where not a known currency."""
+        return _normalize_choices(values, cls.CURRENCY_MAP, currencies)
 
     def _format_rule_columns(self) -> None:
         """Format rule based columns."""
-        action_series = self.formatted_df[Column.Txn.ACTION]
-        for action_value in action_series.dropna().unique():
-            action_mask = action_series == action_value
-            action_indices = self.formatted_df[action_mask].index
+        # Columns written row by row get their own data before any group writes.
+        # Formatted numbers are written back as strings, cast once for all groups
+        for field in self._numeric_columns():
+            self.formatted_df[field] = self.formatted_df[field].astype("object")
+        for column in [
+            Column.Txn.TICKER,
+            *self.optional_columns.get(FieldType.STRING, []),
+        ]:
+            self.formatted_df[column] = self.formatted_df[column].copy()
 
-            if len(action_indices) == 0:  # pragma: no cover
-                continue
+        action_series = self.formatted_df[Column.Txn.ACTION]
+        action_groups = self.formatted_df.groupby(
+            Column.Txn.ACTION,
+            sort=False,
+        ).indices
+        for action_value, positions in action_groups.items():
+            action_indices = self.formatted_df.index[positions]
 
             try:
                 rules = ActionValidationRules.get_rules_for_action(str(action_value))
@@ -517,34 +587,31 @@ class TransactionFormatter:
             required=is_required,
         )
 
+        for column in self.optional_columns.get(FieldType.STRING, []):
+            self._format_string_for_rows(
+                column,
+                rows,
+                required=False,
+            )
+
+        for field in self._numeric_columns():
+            is_required = field in required_fields
+            self._format_numeric_for_rows(
+                field,
+                rows,
+                required=is_required,
+            )
+
+    def _numeric_columns(self) -> list[str]:
+        """Return the numeric columns present in the data, optional fields last."""
         numeric_fields: list[str] = [
             Column.Txn.AMOUNT,
             Column.Txn.PRICE,
             Column.Txn.UNITS,
             Column.Txn.FEE,
+            *self.optional_columns.get(FieldType.NUMERIC, []),
         ]
-
-        if self.config.optional_fields:
-            for column in self.formatted_df.columns:
-                optional_field = self.config.optional_fields.get_field(column)
-                if optional_field and optional_field.field_type == FieldType.NUMERIC:
-                    numeric_fields.append(column)
-                if optional_field and optional_field.field_type == FieldType.STRING:
-                    self._format_string_for_rows(
-                        column,
-                        rows,
-                        required=False,
-                    )
-
-        for field in numeric_fields:
-            if field in self.formatted_df.columns:
-                self.formatted_df[field] = self.formatted_df[field].astype("object")
-                is_required = field in required_fields
-                self._format_numeric_for_rows(
-                    field,
-                    rows,
-                    required=is_required,
-                )
+        return [field for field in numeric_fields if field in self.formatted_df]
 
     def _format_ticker_for_rows(
         self,
@@ -555,41 +622,35 @@ class TransactionFormatter:
     ) -> None:
         """Vectorized formatting of ticker column for specific row indices."""
         col_series = self.formatted_df.loc[indices, column]
-        missing_mask = col_series.isna() | (col_series.astype(str).str.strip() == "")
+        updated_series = col_series.copy()
+        stripped_series = col_series.astype(str).str.strip()
+        missing_mask = (col_series.isna() | (stripped_series == "")).to_numpy()
         if missing_mask.any():
-            missing_indices = col_series[missing_mask].index
+            missing_indices = col_series.index[missing_mask]
             if required:
-                self.exclusions.extend(missing_indices)
-                for idx in missing_indices:
-                    reason = f"MISSING {column}"
-                    self.rejection_reasons.setdefault(idx, []).append(reason)
+                self._reject(missing_indices, f"MISSING {column}")
             else:
-                self.formatted_df.loc[missing_indices, column] = pd.NA
+                updated_series.loc[missing_indices] = pd.NA
 
         non_missing_mask = ~missing_mask
         if non_missing_mask.any():
-            non_missing_series = col_series[non_missing_mask]
-            ticker_str_series = non_missing_series.astype(str).str.strip().str.upper()
+            non_missing_positions = np.flatnonzero(non_missing_mask)
+            non_missing_index = col_series.index[non_missing_positions]
+            ticker_str_series = stripped_series.iloc[non_missing_positions].str.upper()
 
-            ticker_pattern = r"^[A-Z0-9.-]+$"
-            valid_mask = ticker_str_series.str.match(ticker_pattern) & (
-                ticker_str_series.str.len() > 0
+            valid_mask = ticker_str_series.str.fullmatch(TICKER_PATTERN).to_numpy(
+                dtype=bool,
             )
             invalid_mask = ~valid_mask
 
-            if invalid_mask.any():
-                invalid_indices = non_missing_series[invalid_mask].index
-                if required:
-                    self.exclusions.extend(invalid_indices)
-                    for idx in invalid_indices:
-                        reason = f"INVALID {column}"
-                        self.rejection_reasons.setdefault(idx, []).append(reason)
+            if invalid_mask.any() and required:
+                self._reject(non_missing_index[invalid_mask], f"INVALID {column}")
 
             if valid_mask.any():
-                valid_indices = non_missing_series[valid_mask].index
-                self.formatted_df.loc[valid_indices, column] = ticker_str_series[
-                    valid_mask
-                ]
+                valid_indices = non_missing_index[valid_mask]
+                updated_series.loc[valid_indices] = ticker_str_series.iloc[valid_mask]
+
+        self.formatted_df.loc[indices, column] = updated_series
 
     def _format_string_for_rows(
         self,
@@ -600,22 +661,23 @@ class TransactionFormatter:
     ) -> None:
         """Format string column for the given row indices."""
         col_series = self.formatted_df.loc[rows, column]
-        missing_mask = col_series.isna() | (col_series.astype(str).str.strip() == "")
+        updated_series = col_series.copy()
+        stripped_series = col_series.astype(str).str.strip()
+        missing_mask = (col_series.isna() | (stripped_series == "")).to_numpy()
         if missing_mask.any():
-            missing_indices = col_series[missing_mask].index
+            missing_indices = col_series.index[missing_mask]
             if required:  # pragma: no cover
-                self.exclusions.extend(missing_indices)
-                for idx in missing_indices:
-                    reason = f"MISSING {column}"
-                    self.rejection_reasons.setdefault(idx, []).append(reason)
+                self._reject(missing_indices, f"MISSING {column}")
             else:
-                self.formatted_df.loc[missing_indices, column] = pd.NA
+                updated_series.loc[missing_indices] = pd.NA
 
         non_missing_mask = ~missing_mask
         if non_missing_mask.any():
-            non_missing_series = col_series[non_missing_mask]
-            trimmed_series = non_missing_series.astype(str).str.strip()
-            self.formatted_df.loc[non_missing_series.index, column] = trimmed_series
+            updated_series.iloc[non_missing_mask] = stripped_series.iloc[
+                non_missing_mask
+            ]
+
+        self.formatted_df.loc[rows, column] = updated_series
 
     def _format_numeric_for_rows(
         self,
@@ -626,39 +688,35 @@ class TransactionFormatter:
     ) -> None:
         """Format numeric column for the given row indices."""
         col_series = self.formatted_df.loc[indices, column]
-        missing_mask = col_series.isna() | (col_series.astype(str).str.strip() == "")
+        updated_series = col_series.copy()
+        stripped_series = col_series.astype(str).str.strip()
+        missing_mask = (col_series.isna() | (stripped_series == "")).to_numpy()
         if missing_mask.any():
-            missing_indices = col_series[missing_mask].index
+            missing_indices = col_series.index[missing_mask]
             if required:
-                self.exclusions.extend(missing_indices)
-                for idx in missing_indices:
-                    reason = f"MISSING {column}"
-                    self.rejection_reasons.setdefault(idx, []).append(reason)
+                self._reject(missing_indices, f"MISSING {column}")
             else:
-                self.formatted_df.loc[missing_indices, column] = pd.NA
+                updated_series.loc[missing_indices] = pd.NA
 
         non_missing_mask = ~missing_mask
         if non_missing_mask.any():
-            non_missing_series = col_series[non_missing_mask]
-            cleaned_series = (
-                non_missing_series.astype(str)
-                .str.strip()
-                .str.replace("$", "", regex=False)
-                .str.replace(",", "", regex=False)
+            non_missing_positions = np.flatnonzero(non_missing_mask)
+            non_missing_series = col_series.iloc[non_missing_positions]
+            cleaned_series = stripped_series.iloc[non_missing_positions].str.replace(
+                NUMBER_SYMBOLS_PATTERN,
+                "",
+                regex=True,
             )
 
-            formatted_series = cleaned_series.apply(_to_decimal_format)
-            invalid_mask = formatted_series.isna()
+            formatted_series = _to_decimal_formats(cleaned_series)
+            invalid_mask = formatted_series.isna().to_numpy()
             if invalid_mask.any():
-                invalid_indices = non_missing_series[invalid_mask].index
+                invalid_indices = non_missing_series.index[invalid_mask]
                 if required:
-                    self.exclusions.extend(invalid_indices)
-                    for idx in invalid_indices:
-                        reason = f"INVALID {column}"
-                        self.rejection_reasons.setdefault(idx, []).append(reason)
+                    self._reject(invalid_indices, f"INVALID {column}")
                 else:
-                    for idx in invalid_indices:
-                        value = non_missing_series.loc[idx]
+                    invalid_values = non_missing_series.to_numpy()[invalid_mask]
+                    for idx, value in zip(invalid_indices, invalid_values, strict=True):
                         import_logger.debug(
                             "%d - Invalid optional numeric field '%s': '%s'",
                             idx,
@@ -666,12 +724,12 @@ class TransactionFormatter:
                             value,
                         )
 
-            valid_formatted_mask = formatted_series.notna()
-            if valid_formatted_mask.any():
-                valid_indices = non_missing_series[valid_formatted_mask].index
-                self.formatted_df.loc[valid_indices, column] = formatted_series[
-                    valid_formatted_mask
-                ]
+            valid_mask = ~invalid_mask
+            if valid_mask.any():
+                valid_indices = non_missing_series.index[valid_mask]
+                updated_series.loc[valid_indices] = formatted_series.iloc[valid_mask]
+
+        self.formatted_df.loc[indices, column] = updated_series
 
     def _calculate_settlement_dates(self) -> None:
         """Calculate settlement dates for transactions."""
@@ -680,6 +738,30 @@ class TransactionFormatter:
         )
 
 
+def parse_dates(date_series: pd.Series) -> pd.Series:
+    """Parse a Series of dates in various formats to YYYY-MM-DD.
+
+    Same results as applying parse_date to each value, but dates already in
+    ISO form are extracted in one vectorized pass and each distinct remaining
+    value is parsed once.
+
+    Args:
+        date_series: Series of non-missing dates
+
+    Returns:
+        Series of dates in YYYY-MM-DD format, missing where invalid
+    """
+    date_strings = date_series.astype(str).str.strip()
+    parsed_dates = date_strings.str.extract(ISO_DATE_PATTERN, expand=False)
+    other_mask = parsed_dates.isna()
+    if other_mask.any():
+        parsed_dates = parsed_dates.astype(object)
+        other_dates = date_strings[other_mask]
+        parsed_by_value = {value: parse_date(value) for value in other_dates.unique()}
+        parsed_dates[other_mask] = other_dates.map(parsed_by_value)
+    return parsed_dates
+
+
 def parse_date(date_str: str) -> str | None:
     """Parse various date formats to YYYY-MM-DD.
 
@@ -691,44 +773,16 @@ def parse_date(date_str: str) -> str | None:
     """
     date_str = str(date_str).strip()
 
-    # Already in correct format
-    if re.match(r"^\d{4}-\d{2}-\d{2}$", date_str):
-        return date_str
-
-    # Handle ISO 8601 formats with timezone and milliseconds
-    # e.g., "2025-02-05T20:29:41.785270Z" or "2025-02-07T00:00:00Z"
-    iso_pattern = (
-        r"^(\d{4}-\d{2}-\d{2})T\d{2}:\d{2}:\d{2}"
-        r"(?:\.\d+)?(?:Z|[+-]\d{2}:\d{2})?$"
-    )
-    iso_match = re.match(iso_pattern, date_str)
+    # Already in correct format, or an ISO 8601 / space separated datetime
+    # e.g., "2025-02-05T20:29:41.785270Z" or "2025-02-07 00:00:00"
+    iso_match = ISO_DATE_PATTERN.match(date_str)
     if iso_match:
         return iso_match.group(1)
 
-    # Handle datetime formats with space separator
-    # e.g., "2025-02-07 00:00:00"
-    datetime_pattern = r"^(\d{4}-\d{2}-\d{2})\s+\d{2}:\d{2}:\d{2}(?:\.\d+)?$"
-    datetime_match = re.match(datetime_pattern, date_str)
-    if datetime_match:
-        return datetime_match.group(1)
-
-    # Common date formats to try
-    date_formats = [
-        "%Y-%m-%d",  # 2023-01-15
-        "%m/%d/%Y",  # 01/15/2023
-        "%d/%m/%Y",  # 15/01/2023
-        "%m-%d-%Y",  # 01-15-2023
-        "%d-%m-%Y",  # 15-01-2023
-        "%Y/%m/%d",  # 2023/01/15
-        "%d.%m.%Y",  # 15.01.2023
-        "%m.%d.%Y",  # 01.15.2023
-        "%B %d, %Y",  # January 15, 2023
-        "%b %d, %Y",  # Jan 15, 2023
-        "%d %B %Y",  # 15 January 2023
-        "%d %b %Y",  # 15 Jan 2023
-    ]
-
-    for fmt in date_formats:  # pragma: no cover
+    has_whitespace = any(char.isspace() for char in date_str)
+    for separator, fmt in DATE_FORMAT_SEPARATORS:
+        if not (has_whitespace if separator == " " else separator in date_str):
+            continue
         try:
             parsed_date: datetime = datetime.strptime(date_str, fmt).replace(
                 tzinfo=TORONTO_TZ,
@@ -58,3 +58,26 @@ def format_transaction_summary(row: pd.Series) -> str:
         essential_parts.append(f"{col}={value}")
 
     return "|".join(essential_parts)
+
+
+def format_transaction_summaries(df: pd.DataFrame) -> list[str]:
+    """Format every row of a DataFrame like format_transaction_summary.
+
+    Rows are read as plain tuples of the essential columns rather than built
+    into a Series each, as DataFrame.apply(axis=1) would.
+
+    Args:
+        df: A DataFrame containing transaction data.
+
+    Returns:
+        A formatted summary string for each row, in order.
+    """
+    # Missing essentials become NaN columns and are shown as N/A
+    essentials = df.reindex(columns=TXN_ESSENTIALS)
+    return [
+        "|".join(
+            f"{col}={'N/A' if pd.isna(value) else value}"
+            for col, value in zip(TXN_ESSENTIALS, row, strict=True)
+        )
+        for row in essentials.itertuples(index=False, name=None)
+    ]
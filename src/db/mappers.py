@@ -7,7 +7,7 @@ import re
 from typing import TYPE_CHECKING
 
 from app import get_config
-from db.helpers import format_transaction_summary
+from db.helpers import format_transaction_summaries
 from utils import TXN_ESSENTIALS, Column, get_import_logger
 
 if TYPE_CHECKING:
@@ -50,10 +50,16 @@ class TransactionMapper:
                 TransactionMapper._normalize(kw) for kw in field_config.keywords
             }
 
+        # Reverse lookup of keyword -> internal name, first internal name wins
+        keyword_map: dict[str, str] = {}
+        for internal, keywords in norm_keywords.items():
+            for keyword in keywords:
+                keyword_map.setdefault(keyword, internal)
+
         mapping, unmatched, ignored_columns = TransactionMapper._process_columns(
             df.columns,
             normalized_ignore,
-            norm_keywords,
+            keyword_map,
         )
 
         if ignored_columns:
@@ -84,8 +90,7 @@ class TransactionMapper:
         df = df.rename(columns=mapping)
 
         if import_logger.isEnabledFor(logging.INFO):
-            summaries = df.apply(format_transaction_summary, axis=1)
-            for summary in summaries:
+            for summary in format_transaction_summaries(df):
                 import_logger.info(" + %s", summary)
         return df
 
@@ -104,14 +109,14 @@ class TransactionMapper:
     def _process_columns(
         columns: pd.Index,
         normalized_ignore: set[str],
-        norm_keywords: dict[str, set[str]],
+        keyword_map: dict[str, str],
     ) -> tuple[dict[str, str], set[str], list[str]]:
         """Process columns, track unmatched essentials, and identify ignored columns.
 
         Args:
             columns: The columns from the DataFrame.
             normalized_ignore: Set of normalized ignore patterns.
-            norm_keywords: Dictionary of internal names to normalized keywords.
+            keyword_map: Dictionary of normalized keywords to internal names.
 
         Returns:
             Tuple of (mapping dict, unmatched set, ignored columns list).
@@ -123,20 +128,20 @@ class TransactionMapper:
         for column in columns:
             normalized_column = TransactionMapper._normalize(column)
 
+            internal = keyword_map.get(normalized_column)
+
             if TransactionMapper._should_ignore_column(
                 normalized_column,
                 normalized_ignore,
-                norm_keywords,
+                internal,
             ):
                 ignored_columns.append(column)
                 continue
 
             # Map the column if it matches keywords
-            for internal, keywords in norm_keywords.items():
-                if normalized_column in keywords:
-                    mapping[column] = internal
-                    unmatched.discard(internal)
-                    break
+            if internal is not None:
+                mapping[column] = internal
+                unmatched.discard(internal)
 
         return mapping, unmatched, ignored_columns
 
@@ -144,14 +149,14 @@ class TransactionMapper:
     def _should_ignore_column(
         normalized_column: str,
         normalized_ignore: set[str],
-        norm_keywords: dict[str, set[str]],
+        internal: str | None,
     ) -> bool:
         """Check if a column should be ignored.
 
         Args:
             normalized_column: The normalized column name
             normalized_ignore: Set of normalized ignore patterns
-            norm_keywords: Dictionary of internal names to normalized keywords
+            internal: Internal name the column maps to, if any
 
         Returns:
             True if the column should be ignored, False otherwise
@@ -160,13 +165,7 @@ class TransactionMapper:
             return False
 
         # Don't ignore essential columns even if they're in the ignore list
-        is_essential = any(
-            normalized_column in keywords
-            for internal, keywords in norm_keywords.items()
-            if internal in TXN_ESSENTIALS
-        )
-
-        if is_essential:
+        if internal in TXN_ESSENTIALS:
             import_logger.warning(
                 "KEEP column '%s' (in ignore list but essential)",
                 normalized_column,
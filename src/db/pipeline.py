@@ -47,8 +47,16 @@ def prepare_transactions(
         mapped_df,
     )
     formatted_df, excluded_df = TransactionFormatter.format_and_validate(transformed_df)
-    intra_approved_df = TransactionFilter.filter_intra_import_duplicates(formatted_df)
-    db_approved_df = TransactionFilter.filter_db_duplicates(intra_approved_df)
+    # Both duplicate checks compare the same synthetic keys, hash rows only once
+    txn_keys = TransactionFilter.generate_keys(formatted_df)
+    intra_approved_df = TransactionFilter.filter_intra_import_duplicates(
+        formatted_df,
+        txn_keys,
+    )
+    db_approved_df = TransactionFilter.filter_db_duplicates(
+        intra_approved_df,
+        txn_keys,
+    )
     cleaned_df = TransactionMapper.remove_approval_column(db_approved_df)
     final_columns = helpers.sync_txns_table_columns(cleaned_df)
 
@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import logging
 import sqlite3
+import threading
 from contextlib import contextmanager
+from functools import lru_cache
+from operator import itemgetter
 from typing import TYPE_CHECKING
 
 import pandas as pd
@@ -13,35 +16,131 @@ from app import get_config
 
 if TYPE_CHECKING:
     from collections.abc import Generator
+    from pathlib import Path
 
 logger: logging.Logger = logging.getLogger(__name__)
+SMALL_RESULT_ROWS: int = 1000
+# Applied to every connection from get_connection. WAL lets readers run during
+# import writes and, with synchronous=NORMAL, needs a single fsync per commit.
+# busy_timeout comes first so switching to WAL waits for other writers' locks.
+CONNECTION_PRAGMAS: str = """
+PRAGMA busy_timeout=30000;
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-64000;
+"""
+
+# Table columns per open connection, keyed by id() of connections opened through
+# get_connection and discarded when that connection closes.
+_column_cache: dict[int, dict[str, list[str]]] = {}
+# Connection currently open through get_connection on each thread
+_active = threading.local()
 
 
 @contextmanager
 def get_connection() -> Generator[sqlite3.Connection]:
-    """Return sqlite3.Connection. Ensure parent data folder exists."""
+    """Return sqlite3.Connection. Ensure parent data folder exists.
+
+    Nested calls on the same thread for the same database reuse the connection
+    opened by the outermost call, which keeps its page cache and parsed schema
+    warm. Only the outermost call closes it.
+    """
     db_path = get_config().db_path
+    outer: tuple[Path, sqlite3.Connection] | None = getattr(_active, "outer", None)
+    if outer is not None and outer[0] == db_path:
+        yield outer[1]
+        return
     try:
-        conn: sqlite3.Connection = sqlite3.connect(db_path)
+        conn: sqlite3.Connection = sqlite3.connect(db_path, cached_statements=512)
     except sqlite3.OperationalError:
         logger.exception("Error connecting to database: %s", str(db_path))
         raise
+    try:
+        conn.executescript(CONNECTION_PRAGMAS)
+    except sqlite3.OperationalError:
+        logger.exception("Error connecting to database: %s", str(db_path))
+        conn.close()
+        raise
+    _column_cache[id(conn)] = {}
+    _active.outer = (db_path, conn)
     try:
         yield conn
     finally:
-        conn.close()
+        _active.outer = outer
+        _column_cache.pop(id(conn), None)
+        try:
+            conn.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            # Never mask an error raised by the caller or skip closing
+            logger.debug("Skipped PRAGMA optimize for: %s", str(db_path))
+        finally:
+            conn.close()
 
 
 def get_columns(connection: sqlite3.Connection, table_name: str) -> list[str]:
-    """Return list of column names for a table (in defined order)."""
-    cursor = connection.execute(f"PRAGMA table_info('{table_name}')")
-    return [row[1] for row in cursor.fetchall()]
+    """Return list of column names for a table (in defined order).
+
+    Results are cached for connections opened by get_connection until the table
+    is altered or dropped through this module.
+    """
+    table_cache = _column_cache.get(id(connection))
+    if table_cache is not None and table_name in table_cache:
+        return list(table_cache[table_name])
+    cursor = connection.execute(
+        "SELECT name FROM pragma_table_info(?) ORDER BY cid",
+        (table_name,),
+    )
+    columns = [row[0] for row in cursor]
+    # Missing tables are not cached, they may be created by to_sql later on
+    if table_cache is not None and columns:
+        table_cache[table_name] = columns
+    return list(columns)
+
+
+def invalidate_column_cache(
+    connection: sqlite3.Connection,
+    table_name: str | None = None,
+) -> None:
+    """Forget cached columns after a schema change made outside this module.
+
+    Args:
+        connection: Database connection the schema change was made on
+        table_name: Table that changed, or None to forget every table
+    """
+    table_cache = _column_cache.get(id(connection))
+    if table_cache is None:
+        return
+    if table_name is None:
+        table_cache.clear()
+    else:
+        table_cache.pop(table_name, None)
+
+
+@lru_cache(maxsize=256)
+def _select_all_sql(table_name: str) -> str:
+    return f'SELECT * FROM "{table_name}"'
+
+
+@lru_cache(maxsize=256)
+def _count_sql(table_name: str) -> str:
+    return f'SELECT COUNT(*) FROM "{table_name}"'
+
+
+@lru_cache(maxsize=256)
+def _aggregate_sql(function: str, table_name: str, column_name: str) -> str:
+    return f'SELECT {function}("{column_name}") FROM "{table_name}"'
+
+
+@lru_cache(maxsize=256)
+def _distinct_sql(table_name: str, column_name: str) -> str:
+    return f'SELECT DISTINCT "{column_name}" FROM "{table_name}"'
 
 
 def get_tables(connection: sqlite3.Connection) -> list[str]:
     """Return list of table names in the database."""
     cursor = connection.execute("SELECT name FROM sqlite_master WHERE type='table'")
-    return [row[0] for row in cursor.fetchall()]
+    return [row[0] for row in cursor]
 
 
 def get_rows(  # noqa: PLR0913
@@ -59,7 +158,7 @@ def get_rows(  # noqa: PLR0913
     """
     if n is not None and n <= 0:
         n = None
-    query = f'SELECT * FROM "{table_name}"'
+    query = _select_all_sql(table_name)
     if condition:
         query += f" WHERE {condition}"
     if order_by:
@@ -71,8 +170,14 @@ def get_rows(  # noqa: PLR0913
     if n is not None:
         query += f" LIMIT {n}"
     try:
-        df = pd.read_sql_query(query, connection)
-    except pd.errors.DatabaseError:
+        if n is not None and n <= SMALL_RESULT_ROWS:
+            # Small reads skip read_sql_query's per-call setup
+            cursor = connection.execute(query)
+            columns = [description[0] for description in cursor.description]
+            df = pd.DataFrame.from_records(cursor.fetchall(), columns=columns)
+        else:
+            df = pd.read_sql_query(query, connection)
+    except (sqlite3.DatabaseError, pd.errors.DatabaseError):
         return pd.DataFrame()
 
     # For tail, reverse to preserve original order
@@ -87,7 +192,7 @@ def get_row_count(
     condition: str | None = None,
 ) -> int:
     """Return the number of rows in a table, optionally filtered by a condition."""
-    query = f'SELECT COUNT(*) FROM "{table_name}"'
+    query = _count_sql(table_name)
     if condition:
         query += f" WHERE {condition}"
     try:
@@ -103,7 +208,7 @@ def get_max_value(
     condition: str | None = None,
 ) -> str | None:
     """Return the maximum value in a column, optionally filtered by a condition."""
-    query = f'SELECT MAX("{column_name}") FROM "{table_name}"'
+    query = _aggregate_sql("MAX", table_name, column_name)
     if condition:
         query += f" WHERE {condition}"
     try:
@@ -119,7 +224,7 @@ def get_min_value(
     column_name: str,
 ) -> str | None:
     """Return the minimum value in a column."""
-    query = f'SELECT MIN("{column_name}") FROM "{table_name}"'
+    query = _aggregate_sql("MIN", table_name, column_name)
     try:
         result = connection.execute(query).fetchone()
         return result[0] if result and result[0] else None
@@ -135,7 +240,7 @@ def get_distinct_values(
     order_by: str | None = None,
 ) -> pd.DataFrame:
     """Return distinct values from a column with optional filtering and ordering."""
-    query = f'SELECT DISTINCT "{column_name}" FROM "{table_name}"'
+    query = _distinct_sql(table_name, column_name)
 
     if filter_condition:
         query += f" WHERE {filter_condition}"
@@ -157,6 +262,8 @@ def drop_table(connection: sqlite3.Connection, table_name: str) -> None:
         connection.commit()
     except sqlite3.OperationalError:
         logger.exception("Error dropping table: %s", table_name)
+    finally:
+        invalidate_column_cache(connection, table_name)
 
 
 def add_column_to_table(
@@ -185,6 +292,7 @@ def add_column_to_table(
             f'ALTER TABLE "{table_name}" ADD COLUMN "{column_name}" {column_type}'
         )
         connection.execute(alter_sql)
+        invalidate_column_cache(connection, table_name)
         logger.debug("Added column '%s' to table '%s'", column_name, table_name)
     except sqlite3.OperationalError:
         logger.exception(
@@ -224,18 +332,33 @@ def update_rows(
     where_clause = " AND ".join(f'"{col}" = ?' for col in where_columns)
     query = f'UPDATE "{table_name}" SET {set_clause} WHERE {where_clause}'
 
-    try:
-        params_list = []
-        for update_data in updates:
-            set_values = [update_data[col] for col in set_columns]
-            where_values = [update_data[col] for col in where_columns]
-            params_list.append(tuple(set_values + where_values))
+    # One getter for SET then WHERE values, in placeholder order. There is at
+    # least one column of each, so it always returns a tuple. All parameters
+    # are built before the transaction, so an update missing a column raises
+    # KeyError before any row is written.
+    get_params = itemgetter(*set_columns, *where_columns)
+    params = [get_params(update) for update in updates]
 
-        cursor = connection.executemany(query, params_list)
+    # A failed batch is rolled back only if the transaction was started here,
+    # so a caller's uncommitted work is never discarded.
+    began = not connection.in_transaction
+    try:
+        # Take the write lock up front so a WAL reader cannot force a lock
+        # upgrade (and SQLITE_BUSY) partway through the batch.
+        if began:
+            connection.execute("BEGIN IMMEDIATE")
+        cursor = connection.executemany(query, params)
         connection.commit()
     except sqlite3.OperationalError:
+        if began:
+            connection.rollback()
         logger.exception("Error updating rows in table '%s'", table_name)
         return 0
+    except BaseException:
+        # Release the write lock and drop partial updates before re-raising
+        if began:
+            connection.rollback()
+        raise
     else:
         return cursor.rowcount
 
@@ -302,4 +425,3 @@ def delete_rows(
         return 0
     else:
         return cursor.rowcount
-
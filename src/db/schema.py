@@ -14,6 +14,7 @@ from utils.constants import (
     ALIASES_COLUMN_DEFINITIONS,
     FX_COLUMN_DEFINITIONS,
     TXN_COLUMN_DEFINITIONS,
+    Column,
     Table,
 )
 
@@ -35,6 +36,8 @@ def create_txns_table() -> None:
     """
     columns_def = [col_def.to_sql() for col_def in TXN_COLUMN_DEFINITIONS]
     _create_table(Table.TXNS, columns_def)
+    # Duplicate detection looks up existing transactions by date
+    _create_index(Table.TXNS, Column.Txn.TXN_DATE)
 
 
 def create_fx_table() -> None:
@@ -83,3 +86,19 @@ def _create_table(table_name: str, columns_def: list[str]) -> None:
         msg = f"Failed to create table '{table_name}': {e}"
         logger.exception(msg)
         raise
+
+
+def _create_index(table_name: str, column_name: str) -> None:
+    """Create an index on a single column if it doesn't already exist."""
+    sql = (
+        f'CREATE INDEX IF NOT EXISTS "idx_{table_name}_{column_name}" '
+        f'ON "{table_name}" ("{column_name}")'
+    )
+    try:
+        with get_connection() as conn:
+            conn.execute(sql)
+            logger.debug("CREATE index on '%s.%s'", table_name, column_name)
+    except sqlite3.DatabaseError as e:
+        msg = f"Failed to create index on '{table_name}.{column_name}': {e}"
+        logger.exception(msg)
+        raise
@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING
 import pandas as pd
 
 from app import get_config
-from db.helpers import format_transaction_summary
+from db.helpers import format_transaction_summaries, format_transaction_summary
 from models import MergeEvent, TransformEvent
 from utils import Column, get_import_logger
 
@@ -255,12 +255,7 @@ class TransactionTransformer:
 
                 if import_logger.isEnabledFor(logging.INFO):  # pragma: no cover
                     import_logger.info(" + %s", format_transaction_summary(merged_row))
-                    dropped_rows = group_df.apply(
-                        format_transaction_summary,
-                        axis=1,
-                    )
-
-                    for row in dropped_rows:
+                    for row in format_transaction_summaries(group_df):
                         import_logger.info("   - %s", row)
 
                 self._merge_events.append(
@@ -18,7 +18,7 @@ from db import (
     prepare_transactions,
     update_rows,
 )
-from db.helpers import format_transaction_summary
+from db.helpers import format_transaction_summaries, format_transaction_summary
 from utils import Column, Table, get_import_logger, info_both, warning_both
 from utils.backup import rolling_backup
 from utils.settlement_calculator import BUSINESS_DAY_SETTLE_ACTIONS
@@ -56,6 +56,25 @@ def import_transactions(
         Depending on with_results, returns ImportResults or count of imported
         transactions.
     """
+    # Held open for the whole import so the row counts, existing key lookup and
+    # column sync in the pipeline all share one connection.
+    with get_connection():
+        return _import_transactions(
+            folio_path,
+            account,
+            sheet,
+            with_results=with_results,
+        )
+
+
+def _import_transactions(
+    folio_path: Path,
+    account: str | None,
+    sheet: str | None,
+    *,
+    with_results: bool,
+) -> int | ImportResults:
+    """Import transactions, see import_transactions."""
     is_csv: bool = folio_path.suffix.lower() == ".csv"
 
     with get_connection() as conn:
@@ -107,9 +126,9 @@ def import_transactions(
     txn_count = len(prepared_df)
     msg: str = f"DONE: {txn_count} imported"
     import_logger.info(msg)
-    summaries = import_results.final_df.apply(format_transaction_summary, axis=1)
-    for summary in summaries:
-        import_logger.info(" + %s", summary)
+    if import_logger.isEnabledFor(logging.INFO):
+        for summary in format_transaction_summaries(import_results.final_df):
+            import_logger.info(" + %s", summary)
     import_logger.info("TOTAL %d transactions in database", final_count)
     import_logger.info("=" * 80)
     import_logger.info("")
@@ -96,6 +96,22 @@ class ImportResults:
         """Return number of merge operations performed."""
         return len(self.merge_events)
 
+    def flow_summary(self) -> dict[str, int]:
+        """Return every stage count of the import flow in a single mapping.
+
+        Returns:
+            Mapping of stage name to transaction count, in pipeline order.
+        """
+        return {
+            "Read": len(self.read_df),
+            "Merge Candidates": self.merge_candidates(),
+            "Merged Into": len(self.merge_events),
+            "Excluded": len(self.excluded_df),
+            "Intra Rejected": len(self.intra_rejected_df),
+            "DB Rejected": len(self.db_rejected_df),
+            "Imported": len(self.final_df),
+        }
+
     def __int__(self) -> int:  # backwards compatibility if cast to int
         """Return imported count when cast to int (for backwards compatibility)."""
         return self.imported_count()
@@ -8,6 +8,7 @@ from utils.constants import (
     DEFAULT_TICKERS,
     TORONTO_TZ,
     TXN_ESSENTIALS,
+    TXN_NUMERIC_ESSENTIALS,
     Action,
     Column,
     Currency,
@@ -30,6 +31,7 @@ __all__ = [
     "DEFAULT_TICKERS",
     "TORONTO_TZ",
     "TXN_ESSENTIALS",
+    "TXN_NUMERIC_ESSENTIALS",
     "Action",
     "Column",
     "Config",
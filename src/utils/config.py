@@ -8,20 +8,61 @@ from __future__ import annotations
 
 import sys
 from copy import deepcopy
+from functools import cache
 from pathlib import Path
 from types import MappingProxyType
-from typing import Any, ClassVar
-
-import yaml
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from utils.constants import Column
 from utils.optional_fields import OptionalFieldsConfig
 from utils.transforms import TransformsConfig
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from types import ModuleType
+
+
+def _import_yaml() -> tuple[ModuleType, type, type]:
+    """Import PyYAML on first use so CLI startup does not pay for it.
+
+    Returns:
+        The yaml module with its safe loader and dumper, preferring the libyaml C
+        bindings and falling back to the pure Python implementation.
+    """
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as YamlDumper
+        from yaml import CSafeLoader as YamlLoader
+    except ImportError:  # pragma: no cover
+        from yaml import SafeDumper as YamlDumper
+        from yaml import SafeLoader as YamlLoader
+    return yaml, YamlLoader, YamlDumper
+
 
 class Config:
     """Configuration for the folio."""
 
+    __slots__ = (
+        "_backup_path",
+        "_config_path",
+        "_data_path",
+        "_duplicate_approval_column",
+        "_duplicate_approval_value",
+        "_folio_path",
+        "_header_ignore",
+        "_header_keywords",
+        "_imports_path",
+        "_log_level",
+        "_optional_fields",
+        "_processed_path",
+        "_project_root",
+        "_settings",
+        "_sheets",
+        "_statements_path",
+        "_transforms",
+    )
+
     DEFAULT_CONFIG: ClassVar[MappingProxyType[str, Any]] = MappingProxyType(
         {
             "folio_path": "data/folio.xlsx",
@@ -77,6 +118,21 @@ class Config:
         },
     )
 
+    # Read-only keyword catalogs shared by every Config that keeps the defaults.
+    # DEFAULT_CONFIG keeps lists since it is what gets written to config.yaml.
+    DEFAULT_HEADER_KEYWORDS: ClassVar[MappingProxyType[str, tuple[str, ...]]] = (
+        MappingProxyType(
+            {
+                column: tuple(keywords)
+                for column, keywords in DEFAULT_CONFIG["header_keywords"].items()
+            },
+        )
+    )
+
+    # Validated settings keyed by config.yaml path, with the (mtime_ns, size)
+    # they were parsed from so unchanged files skip parsing and validation.
+    _load_cache: ClassVar[dict[Path, tuple[int, int, dict[str, Any]]]] = {}
+
     def __init__(
         self,
         project_root: Path,
@@ -107,6 +163,20 @@ class Config:
         self._optional_fields = OptionalFieldsConfig(optional_columns)
         transforms_config = settings.get("transforms", {})
         self._transforms = TransformsConfig(transforms_config)
+        # Settings read on import hot paths are looked up once here
+        self._log_level: str = settings["log_level"]
+        self._sheets: dict[str, str] = settings["sheets"]
+        self._header_keywords: dict[str, Sequence[str]] = settings["header_keywords"]
+        self._header_ignore: list[str] = settings.get("header_ignore", [])
+        duplicate_config = settings.get("duplicate_approval", {})
+        self._duplicate_approval_column: str = duplicate_config.get(
+            "column_name",
+            "Duplicate",
+        )
+        self._duplicate_approval_value: str = duplicate_config.get(
+            "approval_value",
+            "OK",
+        )
 
     @property
     def config_path(self) -> Path:
@@ -136,34 +206,32 @@ class Config:
     @property
     def log_level(self) -> str:
         """Get the log level."""
-        return self._settings["log_level"]
+        return self._log_level
 
     @property
     def sheets(self) -> dict[str, str]:  # pragma: no cover
         """Get the sheet mappings."""
-        return self._settings["sheets"]
+        return self._sheets
 
     @property
-    def header_keywords(self) -> dict[str, list[str]]:
+    def header_keywords(self) -> dict[str, Sequence[str]]:
         """Get the header keywords mappings."""
-        return self._settings["header_keywords"]
+        return self._header_keywords
 
     @property
     def header_ignore(self) -> list[str]:
         """Get the list of column names to ignore during import."""
-        return self._settings.get("header_ignore", [])
+        return self._header_ignore
 
     @property
     def duplicate_approval_column(self) -> str:
         """Get the name of the column used to approve duplicate transactions."""
-        duplicate_config = self._settings.get("duplicate_approval", {})
-        return duplicate_config.get("column_name", "Duplicate")
+        return self._duplicate_approval_column
 
     @property
     def duplicate_approval_value(self) -> str:
         """Get the value that indicates duplicate transaction approval."""
-        duplicate_config = self._settings.get("duplicate_approval", {})
-        return duplicate_config.get("approval_value", "OK")
+        return self._duplicate_approval_value
 
     @property
     def optional_fields(self) -> OptionalFieldsConfig:
@@ -239,7 +307,7 @@ class Config:
 
         Renamed from tickers_sheet().
         """
-        return self._settings["sheets"]["tickers"]
+        return self._sheets["tickers"]
 
     @property
     def txn_sheet(self) -> str:
@@ -247,7 +315,7 @@ class Config:
 
         Renamed from transactions_sheet().
         """
-        return self._settings["sheets"]["txns"]
+        return self._sheets["txns"]
 
     @property
     def fx_sheet(self) -> str:
@@ -255,7 +323,7 @@ class Config:
 
         Renamed from forex_sheet().
         """
-        return self._settings["sheets"]["fx"]
+        return self._sheets["fx"]
 
     @property
     def txn_parquet(self) -> Path:
@@ -289,25 +357,62 @@ class Config:
             resolved_root = Config.get_default_root_directory()  # pragma: no cover
 
         config_yaml: Path = cls._get_config_path(resolved_root)
-        configuration: dict[str, Any] = deepcopy(dict(cls.DEFAULT_CONFIG))
-        if not config_yaml.exists():
-            with Path.open(config_yaml, "w", encoding="utf-8") as f:
-                yaml.safe_dump(
-                    configuration,
-                    f,
-                    default_flow_style=False,
-                    sort_keys=False,
-                )
+        try:
+            stat = config_yaml.stat()
+        except FileNotFoundError:
+            stat = None
         else:
-            with Path.open(config_yaml, "r", encoding="utf-8") as f:
-                configuration = yaml.safe_load(f) or {}
+            cached = cls._load_cache.get(config_yaml)
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                # A new Config of its own settings, which also recreates folders
+                return cls(resolved_root, deepcopy(cached[2]))
+
+        yaml, yaml_loader, yaml_dumper = _import_yaml()
+        configuration: dict[str, Any] | None = None
+        if stat is None:
+            try:
+                # Exclusive create, so a config.yaml written by another process
+                # since the stat above is read below instead of overwritten.
+                with Path.open(config_yaml, "x", encoding="utf-8") as f:
+                    # Only read from while dumping; validation copies what it changes
+                    configuration = dict(cls.DEFAULT_CONFIG)
+                    yaml.dump(
+                        configuration,
+                        f,
+                        Dumper=yaml_dumper,
+                        default_flow_style=False,
+                        sort_keys=False,
+                    )
+            except FileExistsError:  # pragma: no cover
+                pass
+        if configuration is None:
+            # libyaml decodes the UTF-8 buffer itself; no text-mode file object needed
+            yaml_bytes = config_yaml.read_bytes()
+            configuration = yaml.load(yaml_bytes, Loader=yaml_loader) or {}
 
         configuration = cls._validate_config(configuration)
+        if stat is None:
+            stat = config_yaml.stat()
+        cls._load_cache[config_yaml] = (
+            stat.st_mtime_ns,
+            stat.st_size,
+            deepcopy(configuration),
+        )
         return cls(resolved_root, configuration)
 
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Forget previously loaded configs so the next load re-reads from disk."""
+        cls._load_cache.clear()
+
     @staticmethod
+    @cache
     def get_default_root_directory() -> Path:
-        """Get the project root directory by searching upwards for markers."""
+        """Get the project root directory by searching upwards for markers.
+
+        The search resolves this file and stats each parent, so the result is
+        computed once per process and reused by logging setup and config loading.
+        """
         if getattr(sys, "frozen", False):  # pragma: no cover
             # Running as PyInstaller executable - files in executable directory
             return Path(sys.executable).parent
@@ -334,7 +439,12 @@ class Config:
         Returns:
             Validated configuration
         """
-        validated: dict[str, Any] = deepcopy(dict(Config.DEFAULT_CONFIG))
+        # Shallow copy of the defaults. Only the mappings updated in place by the
+        # validators below need their own copies; every other nested value is
+        # replaced wholesale or copied by its validator before being modified.
+        validated: dict[str, Any] = dict(Config.DEFAULT_CONFIG)
+        validated["sheets"] = dict(validated["sheets"])
+        validated["header_keywords"] = dict(Config.DEFAULT_HEADER_KEYWORDS)
 
         Config._validate_log_level(settings, validated)
         Config._validate_folio_path(settings, validated)
@@ -358,7 +468,7 @@ class Config:
         log_level = settings.get("log_level", validated["log_level"]).upper()
         if log_level not in {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}:
             log_level = validated["log_level"]
-        validated["log_level"] = log_level
+        validated["log_level"] = sys.intern(log_level)
 
     @staticmethod
     def _validate_folio_path(
@@ -379,7 +489,13 @@ class Config:
     @staticmethod
     def _validate_sheets(settings: dict[str, Any], validated: dict[str, Any]) -> None:
         if "sheets" in settings and isinstance(settings["sheets"], dict):
-            validated["sheets"].update(settings["sheets"])
+            # Sheet names are compared and used as keys on every workbook access
+            validated["sheets"].update(
+                {
+                    k: sys.intern(v) if isinstance(v, str) else v
+                    for k, v in settings["sheets"].items()
+                },
+            )
 
     @staticmethod
     def _validate_header_keywords(
@@ -484,28 +600,23 @@ class Config:
 
     def __str__(self) -> str:
         """Return a string representation of the Config object."""
-        config_str = " Config Details:\n"
-        config_str += f"  Config Path: {self.config_path}\n"
-        config_str += f"  Folio Path: {self.folio_path}\n"
-        config_str += f"  Database Path: {self.db_path}\n"
-        config_str += f"  Log Level: {self.log_level}\n"
-        config_str += f"  Sheets: {self.sheets}\n"
-        config_str += (
+        return (
+            " Config Details:\n"
+            f"  Config Path: {self.config_path}\n"
+            f"  Folio Path: {self.folio_path}\n"
+            f"  Database Path: {self.db_path}\n"
+            f"  Log Level: {self.log_level}\n"
+            f"  Sheets: {self.sheets}\n"
             f"  Header Keywords: {len(self.header_keywords)} column(s) mapped\n"
+            f"  Header Ignore: {self.header_ignore}\n"
+            f"  Duplicate Approval Column: {self.duplicate_approval_column}\n"
+            f"  Duplicate Approval Value: {self.duplicate_approval_value}\n"
+            f"  Backup Enabled: {self.backup_enabled}\n"
+            f"  Backup Path: {self.backup_path}\n"
+            f"  Max Backups: {self.max_backups}\n"
+            f"  Transforms: {len(self.transforms.rules)} rule(s) and "
+            f"{len(self.transforms.merge_groups)} merge group(s) configured\n"
         )
-        config_str += f"  Header Ignore: {self.header_ignore}\n"
-        config_str += f"  Duplicate Approval Column: {self.duplicate_approval_column}\n"
-        config_str += f"  Duplicate Approval Value: {self.duplicate_approval_value}\n"
-        config_str += f"  Backup Enabled: {self.backup_enabled}\n"
-        config_str += f"  Backup Path: {self.backup_path}\n"
-        config_str += f"  Max Backups: {self.max_backups}\n"
-        num_rules = len(self.transforms.rules)
-        num_merge_groups = len(self.transforms.merge_groups)
-        config_str += (
-            f"  Transforms: {num_rules} rule(s) and "
-            f"{num_merge_groups} merge group(s) configured\n"
-        )
-        return config_str
 
     def __repr__(self) -> str:
         """Return a concise representation of the Config object."""
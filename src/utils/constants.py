@@ -227,5 +227,12 @@ TXN_ESSENTIALS: list[str] = [
     Column.Txn.ACCOUNT,  # Account alias where transaction occurred
 ]
 
+# Essentials stored as numbers, normalized numerically when building synthetic keys
+TXN_NUMERIC_ESSENTIALS: frozenset[str] = frozenset(
+    col_def.name
+    for col_def in TXN_COLUMN_DEFINITIONS
+    if col_def.name in TXN_ESSENTIALS and col_def.sql_type == NUMERIC_PRECISION
+)
+
 # Default tickers for newly created folio file
 DEFAULT_TICKERS = ["SPY", "AAPL", "O", "REI-UN.TO", "RY.TO"]
@@ -17,7 +17,9 @@ import yaml
 import datagen as _datagen_package
 from app import AppContext, get_config
 from datagen import create_mock_data, get_mock_data_date_range
+from db.filters import TransactionFilter
 from services import ForexService
+from utils.config import Config
 from utils.constants import TORONTO_TZ, Column, Currency
 from utils.settlement_calculator import settlement_calculator
 
@@ -86,8 +88,10 @@ _mock_data_cache: dict[str, Path] = {}
 
 @pytest.fixture(autouse=True)
 def reset_app_context() -> None:
-    """Automatically reset AppContext before each test."""
+    """Automatically reset AppContext and the config and key caches before each test."""
     AppContext.reset_singleton()
+    Config.invalidate_cache()
+    TransactionFilter.invalidate_key_cache()
 
 
 @pytest.fixture(autouse=True)
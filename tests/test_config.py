@@ -1,12 +1,14 @@
 """Tests for the config module."""
 
 import logging
+import shutil
 from pathlib import Path
+from unittest.mock import patch
 
 import yaml
 
 from app import bootstrap
-from utils.config import Config
+from utils.config import Config, _import_yaml
 
 from .test_types import TempContext
 
@@ -107,3 +109,28 @@ def test_bootstrap(tmp_path: Path, temp_ctx: TempContext) -> None:
             for handler in original_handlers:
                 if handler not in root_logger.handlers:
                     root_logger.addHandler(handler)  # pragma: no cover
+
+
+def test_load_reuses_unchanged_config(tmp_path: Path) -> None:
+    config = Config.load(tmp_path)
+
+    # Unchanged config.yaml is not parsed again, but each load gets its own
+    # Config and recreates a deleted data folder.
+    shutil.rmtree(config.data_path)
+    with patch("utils.config._import_yaml") as import_yaml:
+        cached = Config.load(tmp_path)
+    import_yaml.assert_not_called()
+    assert cached is not config
+    assert str(cached) == str(config)
+    assert cached.data_path.is_dir()
+
+    # Rewriting config.yaml changes its size, so the next load re-parses it.
+    with Path.open(config.config_path, "w") as f:
+        yaml.safe_dump({"log_level": "DEBUG"}, f)
+    reloaded = Config.load(tmp_path)
+    assert reloaded.log_level == "DEBUG"
+
+    Config.invalidate_cache()
+    with patch("utils.config._import_yaml", wraps=_import_yaml) as import_yaml:
+        assert Config.load(tmp_path).log_level == "DEBUG"
+    import_yaml.assert_called_once()
@@ -9,9 +9,9 @@ import pandas as pd
 import pytest
 
 from datagen import ensure_data_exists
-from db import create_txns_table
+from db import create_txns_table, get_connection
 from importers import import_statements, import_transactions
-from utils.constants import TXN_ESSENTIALS, Column
+from utils.constants import TXN_ESSENTIALS, Column, Table
 
 from .fixtures.dataframe_cache import register_test_dataframe
 from .helpers.dataframe import verify_db_contents
@@ -522,6 +522,39 @@ def test_import_duplicate_handling(temp_ctx: TempContext) -> None:
         assert intra_approval_count == 2
 
 
+def test_import_duplicates_after_in_place_edit(temp_ctx: TempContext) -> None:
+    """Test DB duplicate detection sees rows edited in place between imports."""
+    with temp_ctx() as ctx:
+        config = ctx.config
+        txn_sheet = config.txn_sheet
+        txn_data = {
+            Column.Txn.TXN_DATE: ["2024-01-01"],
+            Column.Txn.ACTION: ["BUY"],
+            Column.Txn.AMOUNT: [1000.0],
+            Column.Txn.CURRENCY: ["USD"],
+            Column.Txn.PRICE: [100.0],
+            Column.Txn.UNITS: [10.0],
+            Column.Txn.TICKER: ["AAPL"],
+            Column.Txn.ACCOUNT: ["TEST-ACCOUNT"],
+        }
+        txn_path = config.folio_path.parent / "in_place_edit.xlsx"
+        register_test_dataframe(txn_path, pd.DataFrame(txn_data), txn_sheet)
+
+        config.db_path.unlink(missing_ok=True)
+        assert import_transactions(txn_path, "TEST-ACCOUNT", txn_sheet) == 1
+        assert import_transactions(txn_path, "TEST-ACCOUNT", txn_sheet) == 0
+
+        # Same row count and max rowid, different essentials
+        with get_connection() as conn:
+            conn.execute(
+                f'UPDATE "{Table.TXNS}" SET "{Column.Txn.TICKER}" = ?',
+                ("MSFT",),
+            )
+            conn.commit()
+
+        assert import_transactions(txn_path, "TEST-ACCOUNT", txn_sheet) == 1
+
+
 def test_import_missing_essential_column(temp_ctx: TempContext) -> None:
     """Test that import fails when essential column is missing."""
     with temp_ctx() as ctx:
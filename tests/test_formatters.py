@@ -0,0 +1,83 @@
+"""Tests for transaction formatting and date parsing."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from db import formatters
+from db.formatters import TransactionFormatter, parse_date
+from utils.constants import Column
+
+if TYPE_CHECKING:
+    from .test_types import TempContext
+
+
+@pytest.mark.parametrize(
+    ("date_str", "expected"),
+    [
+        ("2023-01-15", "2023-01-15"),
+        ("2023-01-15T20:29:41.785270Z", "2023-01-15"),
+        ("2023-1-5", "2023-01-05"),
+        ("01/15/2023", "2023-01-15"),
+        ("15/01/2023", "2023-01-15"),
+        ("2023/01/15", "2023-01-15"),
+        ("15.01.2023", "2023-01-15"),
+        ("January 15, 2023", "2023-01-15"),
+        ("15 Jan 2023", "2023-01-15"),
+        # A space in a format matches any whitespace
+        ("15\tJan\t2023", "2023-01-15"),
+        ("Jan\t15,\t2023", "2023-01-15"),
+        ("15  January  2023", "2023-01-15"),
+        ("not a date", None),
+        ("15Jan2023", None),
+    ],
+)
+def test_parse_date(date_str: str, expected: str | None) -> None:
+    """Test parse_date across supported formats and separators."""
+    assert parse_date(date_str) == expected
+
+
+def test_format_in_chunks_matches_single_pass(
+    temp_ctx: TempContext,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test chunked formatting gives the same frames and logs as one pass."""
+    rows = 12
+    txn_df = pd.DataFrame(
+        {
+            Column.Txn.TXN_DATE: ["2024-01-02", "01/03/2024", "Jan 4, 2024"] * 4,
+            Column.Txn.ACTION: ["BUY", " sell ", "DIVIDEND"] * 4,
+            Column.Txn.AMOUNT: ["$1,000.50", "2000", "35.5"] * 4,
+            Column.Txn.CURRENCY: ["usd", "CAD", "USD"] * 4,
+            Column.Txn.PRICE: [100.05, 200.0, None] * 4,
+            Column.Txn.UNITS: [10, 10, None] * 4,
+            Column.Txn.TICKER: [" aapl ", "RY.TO", "MSFT"] * 4,
+            Column.Txn.ACCOUNT: ["TEST-ACCOUNT"] * rows,
+            # All missing in the first chunk only
+            Column.Txn.FEE: [None] * 4 + [1.5] * (rows - 4),
+        },
+    )
+    # Every row of the second chunk is excluded
+    txn_df.loc[4:7, Column.Txn.TXN_DATE] = "not a date"
+    txn_df.loc[9, Column.Txn.ACTION] = "UNKNOWN"
+
+    with temp_ctx():
+        with patch.object(formatters.import_logger, "warning") as warning:
+            expected = TransactionFormatter.format_and_validate(txn_df)
+        single_pass_logs = warning.call_args_list
+
+        monkeypatch.setattr(formatters, "FORMAT_CHUNK_ROWS", 4)
+        with patch.object(formatters.import_logger, "warning") as warning:
+            formatted_df, excluded_df = TransactionFormatter.format_and_validate(
+                txn_df,
+            )
+
+    assert len(excluded_df) == 5
+    assert_frame_equal(formatted_df, expected[0])
+    assert_frame_equal(excluded_df, expected[1])
+    assert warning.call_args_list == single_pass_logs
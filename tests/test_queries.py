@@ -0,0 +1,81 @@
+"""Tests for database query helpers."""
+
+from __future__ import annotations
+
+import sqlite3
+from typing import TYPE_CHECKING
+
+import pytest
+
+from db import update_rows
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    """Create a database with a small table of two rows."""
+    path = tmp_path / "test.db"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        'CREATE TABLE "t" ("id" INTEGER PRIMARY KEY, "v" INTEGER CHECK(v < 100))',
+    )
+    conn.executemany('INSERT INTO "t" VALUES (?, ?)', [(1, 1), (2, 2)])
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def conn(db_path: Path) -> Generator[sqlite3.Connection]:
+    """Open a connection to the test database."""
+    connection = sqlite3.connect(db_path, timeout=0)
+    yield connection
+    connection.close()
+
+
+def _values(db_path: Path) -> list[tuple[int, int]]:
+    with sqlite3.connect(db_path) as other:
+        return other.execute('SELECT "id", "v" FROM "t" ORDER BY "id"').fetchall()
+
+
+def test_update_rows_failed_batch_releases_lock(
+    db_path: Path,
+    conn: sqlite3.Connection,
+) -> None:
+    """Test a batch failing partway is rolled back and releases the write lock."""
+    with pytest.raises(sqlite3.IntegrityError):
+        update_rows(conn, "t", [{"id": 1, "v": 9}, {"id": 2, "v": 500}], ["id"], ["v"])
+
+    assert not conn.in_transaction
+    assert _values(db_path) == [(1, 1), (2, 2)]
+    # Another connection can write again
+    with sqlite3.connect(db_path, timeout=0) as other:
+        other.execute('UPDATE "t" SET "v" = 3 WHERE "id" = 2')
+
+
+def test_update_rows_missing_column_writes_nothing(
+    db_path: Path,
+    conn: sqlite3.Connection,
+) -> None:
+    """Test an update missing a column fails before any row is written."""
+    with pytest.raises(KeyError):
+        update_rows(conn, "t", [{"id": 1, "v": 9}, {"id": 2}], ["id"], ["v"])
+
+    assert not conn.in_transaction
+    assert _values(db_path) == [(1, 1), (2, 2)]
+
+
+def test_update_rows_keeps_caller_transaction(
+    db_path: Path,
+    conn: sqlite3.Connection,
+) -> None:
+    """Test a failed batch leaves a transaction opened by the caller intact."""
+    conn.execute('INSERT INTO "t" VALUES (3, 3)')
+    assert update_rows(conn, "missing", [{"id": 1, "v": 9}], ["id"], ["v"]) == 0
+
+    assert conn.in_transaction
+    conn.commit()
+    assert _values(db_path) == [(1, 1), (2, 2), (3, 3)]